@@ -36,6 +36,9 @@ from zoneinfo import ZoneInfo
 # How many upcoming Saturdays to emit
 N_DATES = 12
 
+# libyaml's C loader when PyYAML was built with it; same output, much faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def find_repo_root(start: Path) -> Path:
     """
@@ -54,7 +57,7 @@ def load_yaml(p: Path) -> dict:
     if not p.exists():
         raise FileNotFoundError(f"Missing input YAML: {p}")
     with p.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=YAML_LOADER) or {}
 
 
 def dump_yaml(p: Path, obj) -> None:
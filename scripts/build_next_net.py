@@ -22,6 +22,7 @@ DEFAULT_TZ = "America/New_York"
 HORIZON_DAYS = 60  # search window when finding upcoming occurrences
 WEEK_WINDOW_DAYS = 7  # emit nets happening within this many days
 SUPPORTED_FREQS = {"DAILY", "WEEKLY", "MONTHLY"}
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 DAY_CODES = {
     "MO": 0,
@@ -220,7 +221,7 @@ def load_nets_data(root: Path) -> dict:
                 raise RuntimeError(f"Failed to parse JSON nets file {json_path}: {exc}") from exc
     if yaml_path.exists():
         with yaml_path.open("r", encoding="utf-8") as fp:
-            return yaml.safe_load(fp) or {}
+            return yaml.load(fp, Loader=YAML_LOADER) or {}
     raise FileNotFoundError(f"Missing nets data file: {json_path} (or {yaml_path})")
 
 
@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
-"""Convert `_data/nets.yml` into a JSON file with the same structure.
+"""Convert nets data between YAML and the canonical `_data/nets.json`.
 
-This helper provides a deterministic baseline as we migrate the nets workflow
-from YAML to JSON. It reads the existing YAML data, preserves the familiar key
-ordering, and writes `_data/nets.json` for review.
+`_data/nets.json` is the source of truth: Jekyll, the nets helper, and the
+build scripts all read it directly, so nothing pays a YAML parse at build time.
+This helper covers the two remaining YAML touch points while preserving the
+familiar key ordering:
+
+- `--to json` (default) turns a legacy YAML snapshot into `_data/nets.json`.
+  YAML input is deprecated and prints a note to stderr.
+- `--to yaml` exports the JSON to YAML for anyone who prefers hand-editing in
+  that format; convert it back with `--to json` before committing.
 
 Usage
 =====
@@ -11,18 +17,50 @@ Usage
     python scripts/convert_nets_yaml_to_json.py \
         --input _data/nets.yml \
         --output _data/nets.json
+
+    python scripts/convert_nets_yaml_to_json.py --to yaml \
+        --input _data/nets.json \
+        --output _nets.yml
+
+Keep exported YAML out of `_data/`; Jekyll would load it as `site.data.nets`
+alongside the JSON. The default export target, `_nets.yml` in the repo root,
+is skipped by Jekyll (leading underscore) and ignored by git, as is its
+`._nets.yml.source` sidecar, so a stray export is neither published nor
+committed.
+
+The conversion is skipped when the input bytes hash to the same digest recorded
+in the `.<output>.source` sidecar from the previous run; pass `--force` to
+rebuild regardless.
+
+PyYAML's libyaml bindings (`CSafeLoader`/`CSafeDumper`) are used when available
+and fall back to the pure-Python classes otherwise; likewise `orjson` is used
+to read and write JSON when installed. Output is identical either way.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-from collections import OrderedDict
+import sys
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # optional fast path
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+DEFAULT_PATHS = {
+    "json": (Path("_data/nets.yml"), Path("_data/nets.json")),
+    "yaml": (Path("_data/nets.json"), Path("_nets.yml")),
+}
+
 BASE_NET_KEYS = [
     "id",
     "category",
@@ -58,80 +96,141 @@ OPTIONAL_NET_KEYS = [
 
 TOP_LEVEL_ORDER = ["time_zone", "nets"]
 
+NET_KEY_RANK = {key: idx for idx, key in enumerate(dict.fromkeys([*BASE_NET_KEYS, *OPTIONAL_NET_KEYS]))}
+TOP_LEVEL_RANK = {key: idx for idx, key in enumerate(TOP_LEVEL_ORDER)}
+
 
 def load_yaml(path: Path) -> Any:
     try:
         with path.open("r", encoding="utf-8") as fh:
-            return yaml.safe_load(fh) or {}
+            return yaml.load(fh, Loader=YAML_LOADER) or {}
     except FileNotFoundError:
         raise SystemExit(f"Input file not found: {path}")
     except yaml.YAMLError as exc:  # pragma: no cover - defensive
         raise SystemExit(f"Failed to parse YAML from {path}: {exc}") from exc
 
 
+def load_json(path: Path) -> Any:
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        raise SystemExit(f"Input file not found: {path}")
+    try:
+        if orjson is not None:
+            return orjson.loads(raw) or {}
+        return json.loads(raw) or {}
+    except ValueError as exc:
+        raise SystemExit(f"Failed to parse JSON from {path}: {exc}") from exc
+
+
+def load_source(path: Path) -> Any:
+    if path.suffix.lower() == ".json":
+        return load_json(path)
+    print(
+        f"Note: YAML nets input ({path}) is deprecated; _data/nets.json is the canonical source.",
+        file=sys.stderr,
+    )
+    return load_yaml(path)
+
+
+def dump_yaml(data: Any, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        yaml.dump(data, fh, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True, width=100)
+
+
 def dump_json(data: Any, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
     with path.open("w", encoding="utf-8") as fh:
         json.dump(data, fh, ensure_ascii=False, indent=2)
         fh.write("\n")
 
 
-def normalize_structure(raw: dict[str, Any]) -> OrderedDict:
+def reorder_keys(mapping: dict[str, Any], rank: dict[str, int]) -> dict[str, Any]:
+    unknown = len(rank)
+    return dict(sorted(mapping.items(), key=lambda kv: (rank.get(kv[0], unknown), kv[0])))
+
+
+def normalize_structure(raw: dict[str, Any]) -> dict[str, Any]:
     nets = raw.get("nets")
     if isinstance(nets, list):
-        normalized_nets = []
-        for entry in nets:
-            if not isinstance(entry, dict):
-                normalized_nets.append(entry)
-                continue
-            ordered = OrderedDict()
-            for key in BASE_NET_KEYS:
-                if key in entry:
-                    ordered[key] = entry[key]
-            for key in OPTIONAL_NET_KEYS:
-                if key in entry and key not in ordered:
-                    ordered[key] = entry[key]
-            remaining = sorted(k for k in entry.keys() if k not in ordered)
-            for key in remaining:
-                ordered[key] = entry[key]
-            normalized_nets.append(ordered)
         raw = raw.copy()
-        raw["nets"] = normalized_nets
+        raw["nets"] = [
+            reorder_keys(entry, NET_KEY_RANK) if isinstance(entry, dict) else entry
+            for entry in nets
+        ]
+    return reorder_keys(raw, TOP_LEVEL_RANK)
+
+
+def source_digest(path: Path) -> str:
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    except FileNotFoundError:
+        raise SystemExit(f"Input file not found: {path}")
 
-    ordered_top = OrderedDict()
-    for key in TOP_LEVEL_ORDER:
-        if key in raw:
-            ordered_top[key] = raw[key]
-    for key in sorted(raw.keys()):
-        if key not in ordered_top:
-            ordered_top[key] = raw[key]
-    return ordered_top
 
+def source_marker_path(output_path: Path) -> Path:
+    return output_path.with_name(f".{output_path.name}.source")
 
-def convert(input_path: Path, output_path: Path) -> None:
-    data = load_yaml(input_path)
+
+def is_up_to_date(digest: str, output_path: Path) -> bool:
+    if not output_path.exists():
+        return False
+    try:
+        recorded = source_marker_path(output_path).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return False
+    return recorded == digest
+
+
+def convert(input_path: Path, output_path: Path, force: bool = False, to: str = "json") -> bool:
+    digest = source_digest(input_path)
+    if not force and is_up_to_date(digest, output_path):
+        return False
+    data = load_source(input_path)
     if not isinstance(data, dict):
-        raise SystemExit("Expected top-level mapping in nets YAML.")
+        raise SystemExit(f"Expected top-level mapping in {input_path}.")
     normalized = normalize_structure(data)
-    dump_json(normalized, output_path)
+    if to == "yaml":
+        dump_yaml(normalized, output_path)
+    else:
+        dump_json(normalized, output_path)
+    source_marker_path(output_path).write_text(digest + "\n", encoding="utf-8")
+    return True
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Convert nets YAML to JSON.")
+    parser = argparse.ArgumentParser(description="Convert nets data between YAML and JSON.")
+    parser.add_argument(
+        "--to",
+        choices=sorted(DEFAULT_PATHS),
+        default="json",
+        help="Output format (default: json)",
+    )
     parser.add_argument(
         "--input",
-        default="_data/nets.yml",
         type=Path,
-        help="Path to the YAML file (default: _data/nets.yml)",
+        help="Source file (default: _data/nets.yml for --to json, _data/nets.json for --to yaml)",
     )
     parser.add_argument(
         "--output",
-        default="_data/nets.json",
         type=Path,
-        help="Destination JSON file (default: _data/nets.json)",
+        help="Destination file (default: _data/nets.json for --to json, _nets.yml for --to yaml)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if the input is unchanged since the last run",
     )
     args = parser.parse_args()
-    convert(args.input, args.output)
+    default_input, default_output = DEFAULT_PATHS[args.to]
+    input_path = args.input or default_input
+    output_path = args.output or default_output
+    if not convert(input_path, output_path, force=args.force, to=args.to):
+        print(f"{output_path} is up to date with {input_path}; nothing to do.")
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -5,44 +5,80 @@ Create news posts for CQ Blind Hams episodes using their RSS feed.
 Usage:
   python3 scripts/fetch_cqbh.py [--feed URL] [--output DIR]
                                 [--limit N | --all] [--since YYYY-MM-DD]
-                                [--dry-run]
+                                [--index FILE] [--rebuild-index] [--dry-run]
 
 Defaults:
   --feed   https://anchor.fm/s/123c50ac/podcast/rss
   --output _posts
+  --index  _data/cqbh_guids.json
   --limit  1 (unless --all is set)
 
 Behavior:
   - Reads the RSS feed and sorts items by pubDate (newest first).
   - Selects up to N most-recent items, or all with --all.
   - Optionally filters to items on/after --since (YYYY-MM-DD).
-  - For each unseen episode (based on GUID/title), writes a Jekyll post
+  - For each unseen episode (GUID not in the index), writes a Jekyll post
     whose filename date and front matter date match the RSS pubDate.
   - Embeds an Able Player with the MP3 enclosure.
+  - Records each new GUID -> post path in the index so later runs skip it
+    without scanning _posts. If the index is missing (or --rebuild-index is
+    given) it is back-filled from the `cqbh_guid:` front matter in _posts.
 
-This script uses only the Python standard library for portability.
+This script uses only the Python standard library for portability; if lxml
+is installed it is used to parse the feed faster.
 """
 
 from __future__ import annotations
 
 import argparse
 import html
+import io
+import json
 import os
 import re
 import sys
-import urllib.request
 import urllib.error
+import urllib.request
 import xml.etree.ElementTree as ET
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 from string import Template
 
+try:  # optional: faster parsing and precompiled XPath lookups
+    from lxml import etree as LET
+except ImportError:  # pragma: no cover - stdlib fallback
+    LET = None
+
 
 DEFAULT_FEED = "https://anchor.fm/s/123c50ac/podcast/rss"
+DEFAULT_INDEX = "_data/cqbh_guids.json"
+USER_AGENT = "bhn-fetch-cqbh/1.0"
+# Sort key for items without a parseable pubDate (they sort last)
+UNDATED_SENTINEL = parsedate_to_datetime("Mon, 01 Jan 1990 00:00:00 GMT")
+
+SLUG_DASH_TABLE = str.maketrans({"—": "-", "–": "-"})
+SLUG_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+SLUG_DASH_RUNS = re.compile(r"-+")
+
+GUID_LINE_PATTERN = re.compile(rb"^cqbh_guid:[ \t]*([^\r\n]*?)[ \t]*$", re.MULTILINE)
+
+NS = {
+    "content": "http://purl.org/rss/1.0/modules/content/",
+    "itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd",
+}
+
+if LET is not None:
+    _X_TITLE = LET.XPath("string(title)")
+    _X_CONTENT = LET.XPath("string(content:encoded)", namespaces=NS)
+    _X_DESC = LET.XPath("string(description)")
+    _X_PUB = LET.XPath("string(pubDate)")
+    _X_GUID = LET.XPath("string(guid)")
+    _X_LINK = LET.XPath("string(link)")
+    _X_ENC_URL = LET.XPath("string(enclosure/@url)")
 
 
 def fetch(url: str) -> bytes:
-    req = urllib.request.Request(url, headers={"User-Agent": "bhn-fetch-cqbh/1.0"})
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
     with urllib.request.urlopen(req, timeout=20) as resp:
         return resp.read()
 
@@ -50,37 +86,65 @@ def fetch(url: str) -> bytes:
 def text_of(elem: ET.Element | None) -> str:
     if elem is None:
         return ""
-    # Prefer CDATA if present; ET preserves it as text
-    return (elem.text or "").strip()
+    # All descendant text, like XPath string() on the lxml path; CDATA is plain text here
+    return "".join(elem.itertext()).strip()
 
 
 def make_slug(title: str) -> str:
     base = title.lower().strip()
     # Replace em/en dashes with hyphen
-    base = base.replace("—", "-").replace("–", "-")
+    base = base.translate(SLUG_DASH_TABLE)
     # Replace non-word with hyphen, collapse repeats
-    base = re.sub(r"[^a-z0-9]+", "-", base)
-    base = re.sub(r"-+", "-", base).strip("-")
+    base = SLUG_NON_ALNUM.sub("-", base)
+    base = SLUG_DASH_RUNS.sub("-", base).strip("-")
     return base[:80] or "episode"
 
 
+def item_fields_et(item: ET.Element):
+    title = text_of(item.find("title"))
+    desc_html = text_of(item.find("{http://purl.org/rss/1.0/modules/content/}encoded")) or text_of(item.find("description"))
+    pub_str = text_of(item.find("pubDate"))
+    guid = text_of(item.find("guid")) or text_of(item.find("link"))
+    enc = item.find("enclosure")
+    mp3_url = (enc.get("url") if enc is not None else None) or None
+    return title, desc_html, pub_str, guid, mp3_url
+
+
+def item_fields_lxml(item):
+    title = _X_TITLE(item).strip()
+    desc_html = _X_CONTENT(item).strip() or _X_DESC(item).strip()
+    pub_str = _X_PUB(item).strip()
+    guid = _X_GUID(item).strip() or _X_LINK(item).strip()
+    mp3_url = _X_ENC_URL(item) or None
+    return title, desc_html, pub_str, guid, mp3_url
+
+
+def iter_item_fields(feed_xml: bytes):
+    """Stream <item> fields from the feed, clearing each element once read."""
+    if LET is not None:
+        events = LET.iterparse(
+            io.BytesIO(feed_xml),
+            events=("end",),
+            tag="item",
+            resolve_entities=False,
+            no_network=True,
+        )
+        for _, item in events:
+            yield item_fields_lxml(item)
+            item.clear(keep_tail=False)
+            parent = item.getparent()
+            while parent is not None and item.getprevious() is not None:
+                del parent[0]
+        return
+    for _, item in ET.iterparse(io.BytesIO(feed_xml), events=("end",)):
+        if item.tag == "item":
+            yield item_fields_et(item)
+            item.clear()
+
+
 def extract_items(feed_xml: bytes):
-    ns = {
-        "content": "http://purl.org/rss/1.0/modules/content/",
-        "itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd",
-    }
-    root = ET.fromstring(feed_xml)
-    channel = root.find("channel")
-    if channel is None:
-        return []
     items = []
-    for item in channel.findall("item"):
-        title = text_of(item.find("title"))
-        desc_html = text_of(item.find("{http://purl.org/rss/1.0/modules/content/}encoded")) or text_of(item.find("description"))
-        pub_str = text_of(item.find("pubDate"))
-        guid = text_of(item.find("guid")) or text_of(item.find("link"))
-        enc = item.find("enclosure")
-        mp3_url = enc.get("url") if enc is not None else None
+    for title, desc_html, pub_str, guid, mp3_url in iter_item_fields(feed_xml):
         try:
             pub_dt = parsedate_to_datetime(pub_str) if pub_str else None
         except Exception:
@@ -93,7 +157,7 @@ def extract_items(feed_xml: bytes):
             "mp3_url": mp3_url,
         })
     # Sort descending by pub date if available
-    items.sort(key=lambda x: x["pub_dt"] or parsedate_to_datetime("Mon, 01 Jan 1990 00:00:00 GMT"), reverse=True)
+    items.sort(key=lambda x: x["pub_dt"] or UNDATED_SENTINEL, reverse=True)
     return items
 
 
@@ -117,7 +181,41 @@ $desc_html
 """)
 
 
-def write_post(item: dict, out_dir: Path, dry_run: bool = False) -> Path | None:
+def scan_post_guids(out_dir: Path) -> dict[str, str]:
+    guids: dict[str, str] = {}
+    for p in sorted(out_dir.glob("*.md")):
+        try:
+            data = p.read_bytes()
+        except OSError:
+            continue
+        for m in GUID_LINE_PATTERN.finditer(data):
+            guid = m.group(1).decode("utf-8", errors="ignore")
+            if guid:
+                guids.setdefault(guid, p.as_posix())
+    return guids
+
+
+def load_guid_index(index_path: Path, out_dir: Path, rebuild: bool = False) -> dict[str, str]:
+    if not rebuild:
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            data = None
+        if isinstance(data, dict):
+            return {str(k): str(v) for k, v in data.items()}
+    return scan_post_guids(out_dir)
+
+
+def save_guid_index(index_path: Path, index: dict[str, str]) -> None:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f".{index_path.name}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(dict(sorted(index.items())), fh, ensure_ascii=False, indent=2)
+        fh.write("\n")
+    os.replace(tmp_path, index_path)
+
+
+def write_post(item: dict, out_dir: Path, index: dict[str, str], dry_run: bool = False) -> Path | None:
     title = item["title"].strip() or "CQ Blind Hams — New Episode"
     # Ensure a consistent title prefix for our site
     site_title = title
@@ -141,14 +239,8 @@ def write_post(item: dict, out_dir: Path, dry_run: bool = False) -> Path | None:
 
     # Skip if a post with this guid already exists
     guid = (item["guid"] or item["mp3_url"] or slug).strip()
-    # Quick scan for existing guid in posts
-    for p in sorted(out_dir.glob("*.md")):
-        try:
-            txt = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        if f"cqbh_guid: {guid}" in txt or f"title: \"{title}\"" in txt:
-            return None
+    if guid in index:
+        return None
 
     mp3_url = item["mp3_url"]
     if not mp3_url:
@@ -180,6 +272,7 @@ def write_post(item: dict, out_dir: Path, dry_run: bool = False) -> Path | None:
         return None
 
     path.write_text(content, encoding="utf-8")
+    index[guid] = path.as_posix()
     return path
 
 
@@ -191,6 +284,8 @@ def main():
     group.add_argument("--limit", type=int, default=1, help="number of newest episodes to post")
     group.add_argument("--all", action="store_true", help="create posts for all episodes in the feed")
     ap.add_argument("--since", help="only include episodes on/after this date (YYYY-MM-DD)")
+    ap.add_argument("--index", default=DEFAULT_INDEX, help="JSON map of episode GUID -> post path")
+    ap.add_argument("--rebuild-index", action="store_true", help="re-scan the output directory to rebuild the index")
     ap.add_argument("--dry-run", action="store_true")
     args = ap.parse_args()
 
@@ -218,11 +313,16 @@ def main():
     # Selection: all or limit N
     selected = items if args.all else items[: max(1, args.limit) ]
 
+    index_path = Path(args.index)
+    index = load_guid_index(index_path, out_dir, rebuild=args.rebuild_index)
+    index_changed = args.rebuild_index or not index_path.exists()
     created = []
     for item in selected:
-        path = write_post(item, out_dir, dry_run=args.dry_run)
+        path = write_post(item, out_dir, index, dry_run=args.dry_run)
         if path:
             created.append(path)
+    if (created or index_changed) and not args.dry_run:
+        save_guid_index(index_path, index)
 
     if created:
         for p in created:
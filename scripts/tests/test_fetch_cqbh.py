@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import fetch_cqbh  # noqa: E402
+
+
+SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>CQ Blind Hams</title>
+    <item>
+      <title>Ep <i>3</i>: Antennas</title>
+      <description>Plain description</description>
+      <content:encoded><![CDATA[<p>Rich <b>notes</b></p>]]></content:encoded>
+      <pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate>
+      <guid> guid-3 </guid>
+      <enclosure url="https://example.com/ep3.mp3" type="audio/mpeg"/>
+    </item>
+    <item>
+      <title>Ep 2 \xe2\x80\x94 Nets</title>
+      <description>Second <em>episode</em></description>
+      <link>https://example.com/ep2</link>
+      <enclosure url="" type="audio/mpeg"/>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def test_lxml_and_etree_paths_extract_identical_fields(monkeypatch):
+    if fetch_cqbh.LET is None:
+        pytest.skip("lxml not installed")
+    lxml_fields = list(fetch_cqbh.iter_item_fields(SAMPLE_FEED))
+    monkeypatch.setattr(fetch_cqbh, "LET", None)
+    etree_fields = list(fetch_cqbh.iter_item_fields(SAMPLE_FEED))
+
+    assert lxml_fields == etree_fields
+    assert lxml_fields[0] == (
+        "Ep 3: Antennas",
+        "<p>Rich <b>notes</b></p>",
+        "Mon, 01 Jan 2024 12:00:00 GMT",
+        "guid-3",
+        "https://example.com/ep3.mp3",
+    )
+    assert lxml_fields[1] == ("Ep 2 — Nets", "Second episode", "", "https://example.com/ep2", None)
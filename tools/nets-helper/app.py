@@ -7,20 +7,34 @@ import os
 import re
 import json
 import hashlib
+import hmac
 import shutil
+import stat
+import string
 import subprocess
+import tempfile
 import threading
 import unicodedata
 import textwrap
 import urllib.error
 import urllib.request
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 import yaml
-from flask import Flask, Response, jsonify, render_template, request
+from flask import Flask, Response, render_template, request
+
+try:  # optional: faster JSON encode/decode
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+try:  # optional: SIMD hashing for record hashes
+    import blake3
+except ImportError:  # pragma: no cover - hashlib fallback
+    blake3 = None
 
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -62,6 +76,8 @@ OPTIONAL_FIELD_KEYS = [
 
 ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_\-]*$")
 PENDING_NAME_PATTERN = re.compile(r"^nets\.pending\.(\d{8})_(\d{6})\.json$")
+START_LOCAL_PATTERN = re.compile(r"\d{2}:\d{2}")
+CUSTOM_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "_:-")
 
 BASE_FIELD_KEYS = [
     "id",
@@ -74,6 +90,11 @@ BASE_FIELD_KEYS = [
     "time_zone",
 ]
 
+BASE_FIELD_SET = frozenset(BASE_FIELD_KEYS)
+OPTIONAL_FIELD_SET = frozenset(OPTIONAL_FIELD_KEYS)
+KNOWN_FIELD_SET = BASE_FIELD_SET | OPTIONAL_FIELD_SET
+KNOWN_FIELD_ORDER = tuple(BASE_FIELD_KEYS) + tuple(OPTIONAL_FIELD_KEYS)
+
 CONNECTION_FIELD_MAP = {
     "allstar": ["allstar"],
     "echolink": ["echolink"],
@@ -83,40 +104,68 @@ CONNECTION_FIELD_MAP = {
 }
 
 METADATA_SUFFIX = ".meta.json"
+DEFAULT_FILE_MODE = 0o644
+PENDING_PREFIX = "nets.pending."
 PUBLIC_RATE_LIMIT_WINDOW_SECONDS = 3600
 PUBLIC_RATE_LIMIT_MAX = 3
-PUBLIC_RATE_LIMIT: Dict[str, List[float]] = {}
-PUBLIC_RATE_LIMIT_LOCK = threading.Lock()
-
-
-SLUG_PATTERN = re.compile(r"[^A-Za-z0-9\-]+")
+# Lock striping: identifiers hash into independent (lock, bucket) shards
+PUBLIC_RATE_LIMIT_SHARD_COUNT = 16
+PUBLIC_RATE_LIMIT_SHARDS: List[Tuple[threading.Lock, Dict[str, deque]]] = [
+    (threading.Lock(), {}) for _ in range(PUBLIC_RATE_LIMIT_SHARD_COUNT)
+]
+PUBLIC_RATE_LIMIT_SWEEP_LOCK = threading.Lock()
+PUBLIC_RATE_LIMIT_LAST_SWEEP = 0.0
+
+# Parsed nets payloads (plus a lowercased id -> entry index) keyed by path; an
+# entry is reused while the file's (mtime_ns, size, inode) signature is unchanged.
+NETS_CACHE_MAX_ENTRIES = 32
+NETS_CACHE: "OrderedDict[Path, Tuple[Tuple[int, int, int], Dict[str, Any], Dict[str, Dict[str, Any]]]]" = OrderedDict()
+NETS_CACHE_LOCK = threading.Lock()
+# Derived id -> net and id -> net_digest maps, keyed and bounded like NETS_CACHE
+NETS_MAP_CACHE: "OrderedDict[Path, Tuple[Tuple[int, int, int], Dict[str, Dict[str, Any]], Dict[str, bytes]]]" = OrderedDict()
+
+# libyaml's C loader when PyYAML was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed roles files keyed by path, reused while the file signature is unchanged
+ROLES_CACHE: Dict[Path, Tuple[Optional[Tuple[int, int, int]], Dict[str, set]]] = {}
+ROLES_CACHE_LOCK = threading.Lock()
+
+
+# After ASCII folding: whitespace becomes "-", anything else outside [A-Za-z0-9-] is dropped
+SLUG_TRANSLATION = str.maketrans(
+    {
+        chr(code): ("-" if chr(code).isspace() else None)
+        for code in range(128)
+        if not chr(code).isalnum() and chr(code) != "-"
+    }
+)
+SLUG_DASH_RUNS = re.compile(r"-{2,}")
+AUTHOR_EMAIL_UNSAFE = re.compile(r"[^A-Za-z0-9]+")
+GIT_OBJECT_ID = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")
+GIT_REF_STORAGE_SETTING = re.compile(r"^\s*refstorage\s*=", re.IGNORECASE | re.MULTILINE)
 TOP_LEVEL_ORDER = ["time_zone", "nets"]
 
 
-def default_nets_payload() -> OrderedDict:
-    payload = OrderedDict()
-    payload["time_zone"] = "America/New_York"
-    payload["nets"] = []
-    return payload
-
+def default_nets_payload() -> Dict[str, Any]:
+    return {"time_zone": "America/New_York", "nets": []}
 
-def normalize_net_entry(entry: Dict[str, Any]) -> OrderedDict:
-    ordered: OrderedDict[str, Any] = OrderedDict()
-    for key in BASE_FIELD_KEYS:
-        if key in entry:
-            ordered[key] = entry[key]
 
+def normalize_net_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    ordered = {key: entry[key] for key in BASE_FIELD_KEYS if key in entry}
     for key in OPTIONAL_FIELD_KEYS:
-        if key in entry and key not in ordered and entry[key] not in (None, ""):
+        if key in entry and entry[key] not in (None, ""):
             ordered[key] = entry[key]
 
-    remaining = sorted(k for k in entry.keys() if k not in ordered)
-    for key in remaining:
-        ordered[key] = entry[key]
+    # Only entries with custom (or blank optional) keys need the sorted tail
+    if len(ordered) < len(entry):
+        for key in sorted(entry):
+            if key not in ordered:
+                ordered[key] = entry[key]
     return ordered
 
 
-def normalize_nets_payload(payload: Dict[str, Any]) -> OrderedDict:
+def normalize_nets_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     normalized = default_nets_payload()
     time_zone = payload.get("time_zone")
     if isinstance(time_zone, str) and time_zone.strip():
@@ -136,13 +185,51 @@ def normalize_nets_payload(payload: Dict[str, Any]) -> OrderedDict:
     return normalized
 
 
-def load_nets_payload(path: Path) -> OrderedDict:
+def file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
     try:
-        with path.open("r", encoding="utf-8") as fh:
-            raw = json.load(fh) or {}
+        return stat_signature(path.stat())
+    except OSError:
+        return None
+
+
+def stat_signature(st: os.stat_result) -> Tuple[int, int, int]:
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def invalidate_nets_cache(path: Path) -> None:
+    with NETS_CACHE_LOCK:
+        NETS_CACHE.pop(path, None)
+        NETS_MAP_CACHE.pop(path, None)
+
+
+def _payload_view(payload: Dict[str, Any]) -> Dict[str, Any]:
+    # Callers may replace top-level keys or the nets list; net entries are shared
+    # and must be treated as read-only (copy before mutating).
+    view = payload.copy()
+    if isinstance(view.get("nets"), list):
+        view["nets"] = list(view["nets"])
+    return view
+
+
+def decode_json_bytes(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def encode_json_document(payload: Any) -> bytes:
+    """Serialize as the on-disk format: UTF-8, two-space indent, trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) + b"\n"
+    return (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def read_nets_payload(path: Path) -> Dict[str, Any]:
+    try:
+        raw = decode_json_bytes(path.read_bytes()) or {}
     except FileNotFoundError:
         return default_nets_payload()
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return default_nets_payload()
 
     if not isinstance(raw, dict):
@@ -150,37 +237,129 @@ def load_nets_payload(path: Path) -> OrderedDict:
     return normalize_nets_payload(raw)
 
 
+def net_id_key(net_id: Any) -> str:
+    return str(net_id or "").strip().lower()
+
+
+def build_net_index(nets: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    index: Dict[str, Dict[str, Any]] = {}
+    for entry in nets:
+        if isinstance(entry, dict):
+            # First occurrence wins, matching the old linear scans
+            index.setdefault(net_id_key(entry.get("id")), entry)
+    return index
+
+
+def _load_cached_nets(path: Path) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    signature = file_signature(path)
+    if signature is None:
+        return default_nets_payload(), {}
+    with NETS_CACHE_LOCK:
+        cached = NETS_CACHE.get(path)
+        if cached and cached[0] == signature:
+            NETS_CACHE.move_to_end(path)
+            return cached[1], cached[2]
+
+    return _store_cached_nets(path, signature, read_nets_payload(path))
+
+
+def _store_cached_nets(
+    path: Path,
+    signature: Tuple[int, int, int],
+    payload: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    index = build_net_index(payload.get("nets") or [])
+    with NETS_CACHE_LOCK:
+        NETS_CACHE[path] = (signature, payload, index)
+        NETS_CACHE.move_to_end(path)
+        while len(NETS_CACHE) > NETS_CACHE_MAX_ENTRIES:
+            NETS_CACHE.popitem(last=False)
+    return payload, index
+
+
+def load_nets_payload(path: Path) -> Dict[str, Any]:
+    return _payload_view(_load_cached_nets(path)[0])
+
+
+def load_nets_index(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return the shared id index for ``path``; entries are read-only."""
+    return _load_cached_nets(path)[1]
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> Tuple[int, int, int]:
+    """Atomically replace ``path`` with ``data`` and return the written file's signature."""
+    # A unique temp name per writer, so concurrent saves never share a tmp file
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = DEFAULT_FILE_MODE
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as tmp:
+        tmp_name = tmp.name
+        try:
+            tmp.write(data)
+            tmp.flush()
+            # Taken from our own descriptor: rename keeps inode and mtime, so this is
+            # the signature of what we wrote even if another writer replaces path later
+            signature = stat_signature(os.fstat(tmp.fileno()))
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp_name)
+            raise
+    try:
+        # NamedTemporaryFile creates 0600; keep the published file readable as before
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    return signature
+
+
 def save_nets_payload(path: Path, payload: Dict[str, Any]) -> None:
     normalized = normalize_nets_payload(payload)
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    with tmp_path.open("w", encoding="utf-8") as fh:
-        json.dump(normalized, fh, ensure_ascii=False, indent=2)
-        fh.write("\n")
-    os.replace(tmp_path, path)
+    signature = atomic_write_bytes(path, encode_json_document(normalized))
+    # Seed the cache with what was just written so the next load skips the parse
+    _store_cached_nets(path, signature, normalized)
+
+
+def canonical_record_bytes(record: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def compute_record_digest(record: Dict[str, Any]) -> bytes:
+    # Hashes are only compared within one deployment (form round-trips), so the
+    # algorithm may differ between environments with and without blake3.
+    canonical = canonical_record_bytes(record)
+    if blake3 is not None:
+        return blake3.blake3(canonical).digest()
+    return hashlib.sha256(canonical).digest()
 
 
 def compute_record_hash(record: Dict[str, Any]) -> str:
-    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return compute_record_digest(record).hex()
+
+
+def record_matches_hash(record: Dict[str, Any], expected_hash: str) -> bool:
+    try:
+        expected = bytes.fromhex(expected_hash)
+    except ValueError:
+        return False
+    return hmac.compare_digest(compute_record_digest(record), expected)
 
 
 def extract_entry_record(path: Optional[Path], net_id: str) -> Optional[Dict[str, Any]]:
-    if not path or not path.exists():
+    if not path:
         return None
-    payload = load_nets_payload(path)
-    nets = payload.get("nets") or []
-    target = net_id.strip().lower()
-    for entry in nets:
-        if not isinstance(entry, dict):
-            continue
-        current_id = str(entry.get("id") or "").strip().lower()
-        if current_id == target:
-            return entry
-    return None
+    return load_nets_index(path).get(net_id_key(net_id))
 
 
-def record_to_entry(record: Dict[str, Any]) -> OrderedDict:
+def record_to_entry(record: Dict[str, Any]) -> Dict[str, Any]:
     entry: Dict[str, Any] = {
         "id": record["id"],
         "category": record["category"],
@@ -200,7 +379,8 @@ def record_to_entry(record: Dict[str, Any]) -> OrderedDict:
             entry[key] = value
 
     for key, value in record.get("custom", []):
-        if value not in (None, ""):
+        # Custom fields never override the built-in ones
+        if key not in KNOWN_FIELD_SET and value not in (None, ""):
             entry[key] = value
 
     return normalize_net_entry(entry)
@@ -211,16 +391,13 @@ def slugify(value: str) -> str:
         return ""
     normalized = unicodedata.normalize("NFKD", value)
     normalized = normalized.encode("ascii", "ignore").decode("ascii")
-    normalized = normalized.strip().lower()
-    normalized = re.sub(r"\s+", "-", normalized)
-    normalized = SLUG_PATTERN.sub("", normalized)
-    normalized = re.sub(r"-{2,}", "-", normalized).strip("-")
-    return normalized
+    normalized = normalized.strip().lower().translate(SLUG_TRANSLATION)
+    return SLUG_DASH_RUNS.sub("-", normalized).strip("-")
 
 
-def generate_candidate_id(name: str, existing_ids: Iterable[str]) -> str:
+def generate_candidate_id(name: str, existing_lower: AbstractSet[str]) -> str:
+    """Return a slug ID for `name` not present in `existing_lower` (lowercased IDs)."""
     base = slugify(name) or "net"
-    existing_lower = {str(e).lower() for e in existing_ids}
     if base.lower() not in existing_lower:
         return base
     counter = 2
@@ -235,13 +412,43 @@ class RateLimitExceeded(Exception):
     pass
 
 
+def public_rate_limit_shard(identifier: str) -> Tuple[threading.Lock, Dict[str, deque]]:
+    return PUBLIC_RATE_LIMIT_SHARDS[hash(identifier) % len(PUBLIC_RATE_LIMIT_SHARDS)]
+
+
+def sweep_public_rate_limit(now: float) -> None:
+    """Drop clients with no timestamps left in the window, one shard at a time."""
+    global PUBLIC_RATE_LIMIT_LAST_SWEEP
+    # Whoever gets here first sweeps; everyone else carries on without waiting
+    if not PUBLIC_RATE_LIMIT_SWEEP_LOCK.acquire(blocking=False):
+        return
+    try:
+        if now - PUBLIC_RATE_LIMIT_LAST_SWEEP < PUBLIC_RATE_LIMIT_WINDOW_SECONDS:
+            return
+        PUBLIC_RATE_LIMIT_LAST_SWEEP = now
+        for lock, bucket in PUBLIC_RATE_LIMIT_SHARDS:
+            with lock:
+                for identifier, entries in list(bucket.items()):
+                    if not entries or now - entries[-1] >= PUBLIC_RATE_LIMIT_WINDOW_SECONDS:
+                        del bucket[identifier]
+    finally:
+        PUBLIC_RATE_LIMIT_SWEEP_LOCK.release()
+
+
 def enforce_public_rate_limit(identifier: str) -> None:
     if not identifier:
         identifier = "unknown"
     now = datetime.now(timezone.utc).timestamp()
-    with PUBLIC_RATE_LIMIT_LOCK:
-        entries = PUBLIC_RATE_LIMIT.setdefault(identifier, [])
-        entries[:] = [ts for ts in entries if now - ts < PUBLIC_RATE_LIMIT_WINDOW_SECONDS]
+    if now - PUBLIC_RATE_LIMIT_LAST_SWEEP >= PUBLIC_RATE_LIMIT_WINDOW_SECONDS:
+        sweep_public_rate_limit(now)
+    lock, bucket = public_rate_limit_shard(identifier)
+    with lock:
+        entries = bucket.get(identifier)
+        if entries is None:
+            entries = bucket[identifier] = deque()
+        # Timestamps are appended in order, so expired ones are always at the left
+        while entries and now - entries[0] >= PUBLIC_RATE_LIMIT_WINDOW_SECONDS:
+            entries.popleft()
         if len(entries) >= PUBLIC_RATE_LIMIT_MAX:
             raise RateLimitExceeded()
         entries.append(now)
@@ -253,9 +460,8 @@ def pending_metadata_path(pending_path: Path) -> Path:
 
 def load_pending_metadata(meta_path: Path) -> Dict[str, Any]:
     try:
-        with meta_path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh) or {}
-    except (FileNotFoundError, json.JSONDecodeError):
+        data = decode_json_bytes(meta_path.read_bytes()) or {}
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
         return {}
     if not isinstance(data, dict):
         return {}
@@ -264,8 +470,7 @@ def load_pending_metadata(meta_path: Path) -> Dict[str, Any]:
 
 def write_pending_metadata(meta_path: Path, metadata: Dict[str, Any]) -> None:
     try:
-        with meta_path.open("w", encoding="utf-8") as fh:
-            json.dump(metadata, fh, ensure_ascii=False, indent=2)
+        meta_path.write_bytes(encode_json_document(metadata))
     except OSError:
         # Metadata is helpful but non-critical; ignore write failures.
         pass
@@ -297,8 +502,9 @@ def run_git_command(repo_root: Path, args: List[str], env: Optional[Dict[str, st
 
 
 def git_stage_paths(repo_root: Path, paths: Iterable[Path]) -> None:
-    for path in paths:
-        run_git_command(repo_root, ["add", str(path)])
+    args = [str(path) for path in paths]
+    if args:
+        run_git_command(repo_root, ["add", "--"] + args)
 
 
 def git_has_staged_changes(repo_root: Path) -> bool:
@@ -309,15 +515,50 @@ def git_has_staged_changes(repo_root: Path) -> bool:
     return result.returncode == 1
 
 
+def read_git_head(repo_root: Path) -> Optional[str]:
+    # Reading .git/HEAD directly saves spawning rev-parse; None means "ask git"
+    try:
+        return (repo_root / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def git_uses_ref_storage_extension(repo_root: Path) -> bool:
+    try:
+        config = (repo_root / ".git" / "config").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        # Unknown layout; let the caller ask git
+        return True
+    return GIT_REF_STORAGE_SETTING.search(config) is not None
+
+
+def read_git_head_commit(repo_root: Path) -> Optional[str]:
+    head = read_git_head(repo_root)
+    if not head:
+        return None
+    if head.startswith("ref: "):
+        # git commit always leaves the current branch as a loose ref
+        try:
+            head = (repo_root / ".git" / head[5:]).read_text(encoding="utf-8").strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+    if GIT_OBJECT_ID.match(head):
+        return head
+    return None
+
+
 def git_commit(repo_root: Path, message: str, author: Optional[str] = None) -> str:
     env = os.environ.copy()
     if author:
-        sanitized = re.sub(r"[^A-Za-z0-9]+", ".", author).strip(".") or "nets-helper"
+        sanitized = AUTHOR_EMAIL_UNSAFE.sub(".", author).strip(".") or "nets-helper"
         env.setdefault("GIT_AUTHOR_NAME", author)
         env.setdefault("GIT_COMMITTER_NAME", author)
         env.setdefault("GIT_AUTHOR_EMAIL", f"{sanitized}@blindhams.network")
         env.setdefault("GIT_COMMITTER_EMAIL", f"{sanitized}@blindhams.network")
     run_git_command(repo_root, ["commit", "-m", message], env=env)
+    commit_hash = read_git_head_commit(repo_root)
+    if commit_hash:
+        return commit_hash
     result = run_git_command(repo_root, ["rev-parse", "HEAD"])
     return result.stdout.strip()
 
@@ -327,6 +568,17 @@ def git_push(repo_root: Path, remote: str, branch: str) -> None:
 
 
 def git_current_branch(repo_root: Path) -> str:
+    head = read_git_head(repo_root)
+    if head is not None:
+        if head.startswith("ref: refs/heads/"):
+            branch = head[len("ref: refs/heads/"):]
+            # Non-files ref backends (reftable) leave a stub HEAD such as
+            # "refs/heads/.invalid"; only trust it with the files backend
+            if (repo_root / ".git" / "refs" / "heads" / branch).is_file() or not git_uses_ref_storage_extension(repo_root):
+                return branch
+        elif GIT_OBJECT_ID.match(head):
+            # Detached HEAD
+            return "main"
     try:
         result = run_git_command(repo_root, ["rev-parse", "--abbrev-ref", "HEAD"])
         branch = result.stdout.strip()
@@ -370,7 +622,7 @@ HELP_TEXTS, HELP_LABELS = load_help_texts_file()
 def load_roles_file(path: Path) -> Dict[str, set]:
     try:
         with path.open("r", encoding="utf-8") as fh:
-            raw = yaml.safe_load(fh) or {}
+            raw = yaml.load(fh, Loader=YAML_SAFE_LOADER) or {}
     except FileNotFoundError:
         return {}
     except yaml.YAMLError:
@@ -386,18 +638,55 @@ def load_roles_file(path: Path) -> Dict[str, set]:
     return roles
 
 
-def determine_user_roles(roles_data: Dict[str, Iterable[str]], user: Optional[str]) -> set:
-    if not user:
-        return set()
-    user_roles = set()
+def load_roles_file_cached(path: Path) -> Dict[str, set]:
+    signature = file_signature(path)
+    with ROLES_CACHE_LOCK:
+        cached = ROLES_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    roles = load_roles_file(path)
+    with ROLES_CACHE_LOCK:
+        ROLES_CACHE[path] = (signature, roles)
+    return roles
+
+
+def apply_roles_data(app: Flask, roles_data: Dict[str, set]) -> None:
+    app.config["ROLES_DATA"] = roles_data
+    app.config["USER_ROLES"] = build_user_roles(roles_data)
+    app.config["ROLE_NAMES"] = {
+        "publishers": [str(user) for user in sorted(roles_data.get("publishers", []))],
+        "reviewers": [str(user) for user in sorted(roles_data.get("reviewers", []))],
+    }
+
+
+def build_user_roles(roles_data: Dict[str, Iterable[str]]) -> Dict[str, FrozenSet[str]]:
+    """Invert role -> members into user -> roles for constant-time lookups."""
+    user_roles: Dict[str, set] = {}
     for role, members in roles_data.items():
-        if isinstance(members, Iterable) and user in members:
-            user_roles.add(role)
-    return user_roles
+        if isinstance(members, Iterable):
+            for member in members:
+                user_roles.setdefault(member, set()).add(role)
+    return {user: frozenset(roles) for user, roles in user_roles.items()}
+
+
+def determine_user_roles(user_roles: Dict[str, FrozenSet[str]], user: Optional[str]) -> FrozenSet[str]:
+    if not user:
+        return frozenset()
+    return user_roles.get(user, frozenset())
+
 
+def user_can_promote(user_roles: Dict[str, FrozenSet[str]], user: Optional[str]) -> bool:
+    return "publishers" in determine_user_roles(user_roles, user)
 
-def user_can_promote(roles_data: Dict[str, Iterable[str]], user: Optional[str]) -> bool:
-    return "publishers" in determine_user_roles(roles_data, user)
+
+def json_response(payload: Any, status: int = 200) -> Response:
+    # No default= hook: a non-JSON value (Path, datetime, ...) in a payload is a
+    # bug and should raise, as jsonify did, rather than be stringified silently.
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return Response(body, status=status, mimetype="application/json")
 
 
 def get_current_user(app: Flask) -> Optional[str]:
@@ -414,27 +703,29 @@ def get_current_user(app: Flask) -> Optional[str]:
 def create_app() -> Flask:
     app = Flask(__name__)
     app.config.update(load_config())
-    roles_data = load_roles_file(app.config["ROLES_FILE"])
-    app.config["ROLES_DATA"] = roles_data
-    app.config["ROLE_NAMES"] = {
-        "publishers": [str(user) for user in sorted(roles_data.get("publishers", []))],
-        "reviewers": [str(user) for user in sorted(roles_data.get("reviewers", []))],
-    }
+    apply_roles_data(app, load_roles_file_cached(app.config["ROLES_FILE"]))
+
+    @app.before_request
+    def refresh_roles_data():
+        # Pick up edits to the roles file without a restart; unchanged files hit the cache
+        roles_data = load_roles_file_cached(app.config["ROLES_FILE"])
+        if roles_data is not app.config["ROLES_DATA"]:
+            apply_roles_data(app, roles_data)
 
     @app.post("/api/pending/batch_publish")
     def api_pending_batch_publish():
         """Publish multiple drafts at once, skipping failures."""
 
         current_user = get_current_user(app)
-        if not user_can_promote(app.config["ROLES_DATA"], current_user):
-            return jsonify({"error": "You do not have permission to publish drafts."}), 403
+        if not user_can_promote(app.config["USER_ROLES"], current_user):
+            return json_response({"error": "You do not have permission to publish drafts."}), 403
 
         payload = request.get_json(force=True, silent=True) or {}
         requested_keys = payload.get("keys")
         normalized_keys: Optional[List[str]] = None
         if requested_keys is not None:
             if not isinstance(requested_keys, list):
-                return jsonify({"error": "Submit a list of drafts to publish."}), 400
+                return json_response({"error": "Submit a list of drafts to publish."}), 400
             cleaned: List[str] = []
             for raw_key in requested_keys:
                 if not isinstance(raw_key, str):
@@ -445,7 +736,7 @@ def create_app() -> Flask:
                 cleaned.append(f"pending:{normalized}")
             normalized_keys = list(dict.fromkeys(cleaned))
             if not normalized_keys:
-                return jsonify({"error": "No valid drafts selected."}), 400
+                return json_response({"error": "No valid drafts selected."}), 400
 
         output_dir: Path = app.config["OUTPUT_DIR"]
         nets_file: Path = app.config["NETS_FILE"]
@@ -458,7 +749,7 @@ def create_app() -> Flask:
         pending_lookup = {entry["key"]: entry for entry in pending_entries}
         failed: List[Dict[str, Any]] = []
         if not pending_entries and normalized_keys is None:
-            return jsonify({"error": "No drafts to publish."}), 400
+            return json_response({"error": "No drafts to publish."}), 400
 
         publish_order = normalized_keys or [entry["key"] for entry in pending_entries]
         if normalized_keys is not None:
@@ -467,7 +758,7 @@ def create_app() -> Flask:
                     failed.append({"key": key, "error": "Draft not found."})
             publish_order = [key for key in publish_order if key in pending_lookup]
             if not publish_order:
-                return jsonify({"error": "Selected drafts are no longer available.", "failed": failed}), 400
+                return json_response({"error": "Selected drafts are no longer available.", "failed": failed}), 400
 
         published: List[Dict[str, Any]] = []
         staged_paths: set[Path] = set()
@@ -545,7 +836,7 @@ def create_app() -> Flask:
                 except RuntimeError:
                     pass
                 return (
-                    jsonify({"error": f"Commit/push failed: {exc}", "published": published, "failed": failed}),
+                    json_response({"error": f"Commit/push failed: {exc}", "published": published, "failed": failed}),
                     500,
                 )
 
@@ -574,7 +865,7 @@ def create_app() -> Flask:
         status_code = 200 if published else 400
         if not published and not failed:
             summary["error"] = "No drafts were published."
-        return jsonify(summary), status_code
+        return json_response(summary), status_code
 
     def queue_ntfy_notification(title: str, message: str, tags: Optional[List[str]] = None) -> None:
         endpoint = app.config.get("NTFY_ENDPOINT", "")
@@ -663,10 +954,10 @@ def create_app() -> Flask:
         context = load_context(app.config, source_key, current_user)
         normalized, errors = normalize_submission(data, context["existing_ids"], context["default_time_zone"])
         if errors:
-            return jsonify({"errors": errors}), 400
+            return json_response({"errors": errors}), 400
         entry = record_to_entry(normalized)
         snippet = build_json_preview(entry)
-        return jsonify({"snippet": snippet})
+        return json_response({"snippet": snippet})
 
     @app.post("/api/save")
     def api_save():
@@ -676,7 +967,7 @@ def create_app() -> Flask:
         context = load_context(app.config, source_key, current_user)
         normalized, errors = normalize_submission(data, context["existing_ids"], context["default_time_zone"])
         if errors:
-            return jsonify({"errors": errors}), 400
+            return json_response({"errors": errors}), 400
 
         mode = (data.get("mode") or "add").strip().lower()
         original_id = (data.get("original_id") or "").strip()
@@ -712,11 +1003,11 @@ def create_app() -> Flask:
             )
         except ValueError as exc:
             message = str(exc)
-            return jsonify({"errors": {"conflict": message, "original_id": message}}), 409
+            return json_response({"errors": {"conflict": message, "original_id": message}}), 409
 
         pending_key = f"pending:{pending_path.name}"
 
-        return jsonify(
+        return json_response(
             {
                 "message": "Draft saved for review.",
                 "pending_path": str(pending_path),
@@ -737,12 +1028,12 @@ def create_app() -> Flask:
         payload = request.get_json(force=True, silent=True) or {}
         nets_payload = payload.get("nets")
         if not isinstance(nets_payload, list) or not nets_payload:
-            return jsonify({"error": "Submit at least one net in the batch."}), 400
+            return json_response({"error": "Submit at least one net in the batch."}), 400
 
         current_user = get_current_user(app)
         context = load_context(app.config, "nets", current_user)
         if not context["permissions"].get("can_review"):
-            return jsonify({"error": "You do not have permission to submit drafts."}), 403
+            return json_response({"error": "You do not have permission to submit drafts."}), 403
 
         default_time_zone = context["default_time_zone"]
         accumulated_errors: Dict[str, Dict[str, str]] = {}
@@ -775,9 +1066,9 @@ def create_app() -> Flask:
             dynamic_ids.append(record["id"])
 
         if accumulated_errors:
-            return jsonify({"errors": accumulated_errors}), 400
+            return json_response({"errors": accumulated_errors}), 400
         if not normalized_records:
-            return jsonify({"error": "No valid changes were provided."}), 400
+            return json_response({"error": "No valid changes were provided."}), 400
 
         changes = []
         for record in normalized_records:
@@ -837,7 +1128,7 @@ def create_app() -> Flask:
             tags=["inbox"],
         )
 
-        return jsonify(response_payload)
+        return json_response(response_payload)
 
     @app.get("/api/pending")
     def api_pending():
@@ -845,7 +1136,7 @@ def create_app() -> Flask:
         current_user = get_current_user(app)
         context = load_context(app.config, source_key, current_user)
         summaries = summarize_pending_files(context["pending_files"], context["canonical_file"])
-        return jsonify(
+        return json_response(
             {
                 "active_source": context["active_source_key"],
                 "options": context["source_options"],
@@ -866,26 +1157,26 @@ def create_app() -> Flask:
         elif mode == "single":
             key = payload.get("key")
             if not isinstance(key, str):
-                return jsonify({"error": "Specify which draft to delete."}), 400
+                return json_response({"error": "Specify which draft to delete."}), 400
             try:
                 deleted = delete_single_pending(output_dir, key)
             except FileNotFoundError:
-                return jsonify({"error": "Draft not found."}), 404
+                return json_response({"error": "Draft not found."}), 404
         else:
-            return jsonify({"error": "Unsupported delete mode."}), 400
+            return json_response({"error": "Unsupported delete mode."}), 400
 
-        return jsonify({"deleted": deleted})
+        return json_response({"deleted": deleted})
 
     @app.post("/api/pending/promote")
     def api_pending_promote():
         current_user = get_current_user(app)
-        if not user_can_promote(app.config["ROLES_DATA"], current_user):
-            return jsonify({"error": "You do not have permission to publish drafts."}), 403
+        if not user_can_promote(app.config["USER_ROLES"], current_user):
+            return json_response({"error": "You do not have permission to publish drafts."}), 403
 
         payload = request.get_json(force=True, silent=True) or {}
         key = payload.get("key")
         if not isinstance(key, str):
-            return jsonify({"error": "Specify which draft to publish."}), 400
+            return json_response({"error": "Specify which draft to publish."}), 400
 
         try:
             result = promote_pending_file(
@@ -895,9 +1186,9 @@ def create_app() -> Flask:
                 current_user=current_user,
             )
         except FileNotFoundError:
-            return jsonify({"error": "Draft not found."}), 404
+            return json_response({"error": "Draft not found."}), 404
         except ValueError as exc:
-            return jsonify({"error": str(exc)}), 400
+            return json_response({"error": str(exc)}), 400
 
         response_payload = result
         queue_ntfy_notification(
@@ -905,18 +1196,18 @@ def create_app() -> Flask:
             f"Published by: {current_user or 'unknown'}\nDraft: {result.get('promoted', '')}",
             tags=["checkered_flag"],
         )
-        return jsonify(response_payload)
+        return json_response(response_payload)
 
     @app.post("/api/pending/promote_commit")
     def api_pending_promote_commit():
         current_user = get_current_user(app)
-        if not user_can_promote(app.config["ROLES_DATA"], current_user):
-            return jsonify({"error": "You do not have permission to publish drafts."}), 403
+        if not user_can_promote(app.config["USER_ROLES"], current_user):
+            return json_response({"error": "You do not have permission to publish drafts."}), 403
 
         payload = request.get_json(force=True, silent=True) or {}
         key = payload.get("key")
         if not isinstance(key, str):
-            return jsonify({"error": "Specify which draft to publish."}), 400
+            return json_response({"error": "Specify which draft to publish."}), 400
 
         output_dir: Path = app.config["OUTPUT_DIR"]
         nets_file: Path = app.config["NETS_FILE"]
@@ -928,11 +1219,11 @@ def create_app() -> Flask:
         pending_entries = list_pending_files(output_dir)
         pending_lookup = {entry["key"]: entry for entry in pending_entries}
         if key not in pending_lookup:
-            return jsonify({"error": "Draft not found."}), 404
+            return json_response({"error": "Draft not found."}), 404
 
         summary_list = summarize_pending_files([pending_lookup[key]], nets_file)
         if not summary_list:
-            return jsonify({"error": "Unable to summarize draft."}), 400
+            return json_response({"error": "Unable to summarize draft."}), 400
         summary_entry = summary_list[0]
 
         try:
@@ -943,9 +1234,9 @@ def create_app() -> Flask:
                 current_user=current_user,
             )
         except FileNotFoundError:
-            return jsonify({"error": "Draft not found."}), 404
+            return json_response({"error": "Draft not found."}), 404
         except ValueError as exc:
-            return jsonify({"error": str(exc)}), 400
+            return json_response({"error": str(exc)}), 400
 
         nets_rel = nets_file.relative_to(repo_root)
         paths_to_stage = [nets_rel]
@@ -992,7 +1283,7 @@ def create_app() -> Flask:
                     "\n".join(publish_lines),
                     tags=["checkered_flag"],
                 )
-                return jsonify(response_payload)
+                return json_response(response_payload)
 
             commit_msg = payload.get("commit_message")
             if not isinstance(commit_msg, str) or not commit_msg.strip():
@@ -1018,7 +1309,7 @@ def create_app() -> Flask:
                 run_git_command(repo_root, ["reset", "--mixed"])
             except RuntimeError:
                 pass
-            return jsonify({"error": str(exc)}), 500
+            return json_response({"error": str(exc)}), 500
 
         response_payload = {
             "message": promote_result.get("message", "Draft published."),
@@ -1062,7 +1353,7 @@ def create_app() -> Flask:
             "\n".join(publish_lines),
             tags=["checkered_flag"],
         )
-        return jsonify(response_payload)
+        return json_response(response_payload)
 
     @app.post("/api/public/suggest")
     def api_public_suggest():
@@ -1070,19 +1361,19 @@ def create_app() -> Flask:
         if not payload:
             payload = request.form.to_dict()
         if not payload:
-            return jsonify({"error": "No data submitted."}), 400
+            return json_response({"error": "No data submitted."}), 400
 
         honeypot = (payload.get("website") or payload.get("url") or "").strip()
         if honeypot:
             # silently accept to confuse bots
-            return jsonify({"message": "Submission received."}), 204
+            return json_response({"message": "Submission received."}), 204
 
         client_ip = request.headers.get("X-Forwarded-For", request.remote_addr or "")
         client_ip = client_ip.split(",")[0].strip()
         try:
             enforce_public_rate_limit(client_ip)
         except RateLimitExceeded:
-            return jsonify({"error": "Too many submissions from this address. Please try again later."}), 429
+            return json_response({"error": "Too many submissions from this address. Please try again later."}), 429
 
         name = (payload.get("name") or "").strip()
         description = (payload.get("description") or "").strip()
@@ -1101,20 +1392,21 @@ def create_app() -> Flask:
         mode = (payload.get("mode") or payload.get("hf_mode") or "").strip()
 
         if not name or not description or not start_local or not duration or not rrule or not contact_email:
-            return jsonify({"error": "Missing required fields."}), 400
+            return json_response({"error": "Missing required fields."}), 400
 
         context = load_context(app.config, "nets", None)
-        existing_ids = set(context.get("existing_ids", []))
+        # One lowercased set serves both ID generation and the duplicate check
+        existing_ids = {str(net_id).lower() for net_id in context.get("existing_ids", [])}
         for net in context.get("nets_data", []):
             net_id = str(net.get("id") or "").strip()
             if net_id:
-                existing_ids.add(net_id)
+                existing_ids.add(net_id.lower())
         pending_entries = context.get("pending_context", {}).get("pending", [])
         for entry in pending_entries:
             for change in entry.get("changes", []):
                 change_id = str(change.get("id") or "").strip()
                 if change_id:
-                    existing_ids.add(change_id)
+                    existing_ids.add(change_id.lower())
 
         candidate_id = generate_candidate_id(name, existing_ids)
 
@@ -1129,7 +1421,7 @@ def create_app() -> Flask:
         try:
             duration_int = int(str(duration).strip())
         except ValueError:
-            return jsonify({"error": "Duration must be a number (minutes)."}), 400
+            return json_response({"error": "Duration must be a number (minutes)."}), 400
         submission_data["duration_min"] = str(duration_int)
         submission_data["rrule"] = rrule
         submission_data["time_zone"] = time_zone
@@ -1150,7 +1442,7 @@ def create_app() -> Flask:
 
         normalized, errors = normalize_submission(submission_data, existing_ids, context["default_time_zone"])
         if errors:
-            return jsonify({"errors": errors}), 400
+            return json_response({"errors": errors}), 400
 
         metadata = {
             "submitted_via": "public_form",
@@ -1175,7 +1467,7 @@ def create_app() -> Flask:
                 metadata=metadata,
             )
         except ValueError as exc:
-            return jsonify({"error": str(exc)}), 400
+            return json_response({"error": str(exc)}), 400
 
         summary_lines = [
             f"Submission: {normalized.get('name', '(no name)')}",
@@ -1191,7 +1483,7 @@ def create_app() -> Flask:
             tags=["mailbox"],
         )
 
-        return jsonify(
+        return json_response(
             {
                 "message": "Submission received. A moderator will review it soon.",
                 "generated_id": normalized["id"],
@@ -1206,7 +1498,7 @@ def create_app() -> Flask:
         current_user = get_current_user(app)
         context = load_context(app.config, source_key, current_user)
         nets_summary = build_nets_summary(context["nets_data"])
-        return jsonify(
+        return json_response(
             {
                 "nets": nets_summary,
                 "active_source": context["active_source_key"],
@@ -1220,9 +1512,9 @@ def create_app() -> Flask:
         source_key = request.args.get("source")
         current_user = get_current_user(app)
         context = load_context(app.config, source_key, current_user)
-        target_net, actual_id = find_net_by_id(context["nets_data"], net_id)
+        target_net, actual_id = find_net_by_id(context["nets_data"], net_id, context["nets_index"])
         if not target_net:
-            return jsonify({"error": "Net not found in the current snapshot."}), 404
+            return json_response({"error": "Net not found in the current snapshot."}), 404
 
         metadata_entry = {}
         if context["active_source_key"].startswith("pending:"):
@@ -1237,7 +1529,7 @@ def create_app() -> Flask:
         )
         label = build_edit_label(actual_id, target_net.get("name"))
 
-        return jsonify(
+        return json_response(
             {
                 "net": form_state,
                 "original_id": actual_id,
@@ -1253,16 +1545,16 @@ def create_app() -> Flask:
     def api_pending_net_detail(pending_key: str, net_id: str):
         normalized_key = normalize_pending_key(pending_key)
         if not normalized_key:
-            return jsonify({"error": "Invalid pending key."}), 400
+            return json_response({"error": "Invalid pending key."}), 400
         pending_source_key = f"pending:{normalized_key}"
         pending_path = (app.config["OUTPUT_DIR"] / "pending" / normalized_key).resolve()
         if not pending_path.is_file():
-            return jsonify({"error": "Pending draft not found."}), 404
+            return json_response({"error": "Pending draft not found."}), 404
         current_user = get_current_user(app)
         context = load_context(app.config, pending_source_key, current_user)
-        target_net, actual_id = find_net_by_id(context["nets_data"], net_id)
+        target_net, actual_id = find_net_by_id(context["nets_data"], net_id, context["nets_index"])
         if not target_net:
-            return jsonify({"error": "Net not found in the pending snapshot."}), 404
+            return json_response({"error": "Net not found in the pending snapshot."}), 404
 
         metadata_entry = context.get("pending_metadata", {}).get(pending_source_key, {})
         form_state = build_form_state(
@@ -1274,7 +1566,7 @@ def create_app() -> Flask:
             treat_as_new=False,
         )
         label = build_edit_label(actual_id, target_net.get("name"))
-        return jsonify(
+        return json_response(
             {
                 "net": form_state,
                 "original_id": actual_id,
@@ -1290,6 +1582,19 @@ def create_app() -> Flask:
     return app
 
 
+def find_repo_root(start: Path) -> Path:
+    """Nearest ancestor of ``start`` (itself included) with a .git directory, else ``start``."""
+    for current in (start, *start.parents):
+        if current.parent == current:
+            break
+        try:
+            if stat.S_ISDIR(os.stat(current / ".git").st_mode):
+                return current
+        except OSError:
+            continue
+    return start
+
+
 def load_config() -> Dict[str, Path]:
     repo_root = BASE_DIR.parent
 
@@ -1314,14 +1619,7 @@ def load_config() -> Dict[str, Path]:
     nets_file = nets_file.resolve(strict=False)
     output_dir = output_dir.resolve(strict=False)
     roles_file = roles_file.resolve(strict=False)
-    resolved_nets = nets_file.resolve()
-    repo_root = resolved_nets.parent
-    current = repo_root
-    while current.parent != current:
-        if (current / ".git").is_dir():
-            repo_root = current
-            break
-        current = current.parent
+    repo_root = find_repo_root(nets_file.parent)
 
     auto_push_env = os.environ.get("BHN_NETS_AUTO_PUSH", "1").strip().lower()
     auto_push = auto_push_env not in {"0", "false", "off", "no"}
@@ -1345,8 +1643,9 @@ def load_config() -> Dict[str, Path]:
 def load_context(config: Dict, source_key: Optional[str] = None, current_user: Optional[str] = None) -> Dict:
     nets_file: Path = config["NETS_FILE"]
     output_dir: Path = config["OUTPUT_DIR"]
-    pending_files = list_pending_files(output_dir)
-    pending_file = find_latest_pending_file(output_dir)
+    pending_scan = scan_pending_dir(output_dir)
+    pending_files = list_pending_files(output_dir, pending_scan)
+    pending_file = find_latest_pending_file(output_dir, pending_scan)
     source_map: Dict[str, Path] = {"nets": nets_file}
     for entry in pending_files:
         source_map[entry["key"]] = Path(entry["path"])
@@ -1361,9 +1660,10 @@ def load_context(config: Dict, source_key: Optional[str] = None, current_user: O
     existing_ids: List[str] = []
 
     nets_data: List[Dict[str, Any]] = []
+    nets_index: Dict[str, Dict[str, Any]] = {}
 
     if working_file.exists():
-        data = load_nets_payload(working_file)
+        data, nets_index = _load_cached_nets(working_file)
         default_time_zone = data.get("time_zone", default_time_zone)
         nets = data.get("nets", []) or []
         for net in nets:
@@ -1384,8 +1684,7 @@ def load_context(config: Dict, source_key: Optional[str] = None, current_user: O
         time_zones.insert(0, default_time_zone)
 
     source_options = build_source_options(pending_files, nets_file, active_source_key)
-    roles_data = config.get("ROLES_DATA", {})
-    user_roles = determine_user_roles(roles_data, current_user)
+    user_roles = determine_user_roles(config.get("USER_ROLES", {}), current_user)
     permissions = {
         "can_review": bool(user_roles),
         "can_promote": "publishers" in user_roles,
@@ -1431,33 +1730,51 @@ def load_context(config: Dict, source_key: Optional[str] = None, current_user: O
         "help_texts": HELP_TEXTS,
         "help_labels": HELP_LABELS,
         "nets_data": nets_data,
+        "nets_index": nets_index,
         "current_user": current_user,
-        "roles": list(user_roles),
+        "roles": sorted(user_roles),
         "permissions": permissions,
     }
 
 
-def find_latest_pending_file(output_dir: Path) -> Optional[Path]:
-    pending_dir = output_dir / "pending"
-    if not pending_dir.is_dir():
-        return None
+def scan_pending_dir(output_dir: Path) -> Tuple[List[Path], AbstractSet[str]]:
+    """Return pending snapshots (newest first) and the sidecar names seen, in one scandir pass."""
+    snapshots: List[Path] = []
+    metadata_names = set()
+    try:
+        with os.scandir(output_dir / "pending") as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(METADATA_SUFFIX):
+                    metadata_names.add(name)
+                elif is_pending_snapshot_name(name) and entry.is_file():
+                    snapshots.append(Path(entry.path))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    snapshots.sort(key=lambda p: p.name, reverse=True)
+    return snapshots, metadata_names
 
-    candidates = sorted(iter_pending_snapshot_paths(pending_dir), key=lambda p: p.name, reverse=True)
-    if not candidates:
-        return None
-    return candidates[0]
 
+def find_latest_pending_file(
+    output_dir: Path,
+    scan: Optional[Tuple[List[Path], AbstractSet[str]]] = None,
+) -> Optional[Path]:
+    snapshots, _ = scan if scan is not None else scan_pending_dir(output_dir)
+    return snapshots[0] if snapshots else None
 
-def list_pending_files(output_dir: Path) -> List[Dict[str, str]]:
-    pending_dir = output_dir / "pending"
-    if not pending_dir.is_dir():
-        return []
+
+def list_pending_files(
+    output_dir: Path,
+    scan: Optional[Tuple[List[Path], AbstractSet[str]]] = None,
+) -> List[Dict[str, str]]:
+    snapshots, metadata_names = scan if scan is not None else scan_pending_dir(output_dir)
 
     entries: List[Dict[str, str]] = []
-    for path in sorted(iter_pending_snapshot_paths(pending_dir), key=lambda p: p.name, reverse=True):
+    for path in snapshots:
         label, iso_timestamp = pending_label_from_name(path.name)
         meta_path = pending_metadata_path(path)
-        metadata = load_pending_metadata(meta_path)
+        # Only open sidecars the directory scan actually saw
+        metadata = load_pending_metadata(meta_path) if meta_path.name in metadata_names else {}
         entries.append(
             {
                 "key": f"pending:{path.name}",
@@ -1474,13 +1791,13 @@ def list_pending_files(output_dir: Path) -> List[Dict[str, str]]:
     return entries
 
 
-def iter_pending_snapshot_paths(pending_dir: Path):
-    for path in pending_dir.glob("nets.pending.*.json"):
-        if not path.is_file():
-            continue
-        if path.name.endswith(".meta.json"):
-            continue
-        yield path
+def is_pending_snapshot_name(name: str) -> bool:
+    return (
+        name.startswith(PENDING_PREFIX)
+        and name.endswith(".json")
+        and not name.endswith(METADATA_SUFFIX)
+        and len(name) >= len(PENDING_PREFIX) + len(".json")
+    )
 
 
 def pending_label_from_name(filename: str) -> Tuple[str, Optional[str]]:
@@ -1488,11 +1805,20 @@ def pending_label_from_name(filename: str) -> Tuple[str, Optional[str]]:
     if not match:
         return filename, None
     date_part, time_part = match.groups()
+    # The pattern guarantees fixed-width digits, so slicing replaces strptime
     try:
-        dt = datetime.strptime(f"{date_part}{time_part}", "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+        dt = datetime(
+            int(date_part[:4]),
+            int(date_part[4:6]),
+            int(date_part[6:]),
+            int(time_part[:2]),
+            int(time_part[2:4]),
+            int(time_part[4:]),
+            tzinfo=timezone.utc,
+        )
     except ValueError:
         return filename, None
-    label = dt.astimezone(timezone.utc).strftime("Created %Y-%m-%d %H:%M:%S UTC")
+    label = f"Created {date_part[:4]}-{date_part[4:6]}-{date_part[6:]} {time_part[:2]}:{time_part[2:4]}:{time_part[4:]} UTC"
     return label, dt.isoformat()
 
 
@@ -1533,13 +1859,27 @@ def build_source_options(pending_files: List[Dict[str, str]], nets_file: Path, a
     return options
 
 
+def pending_path_from_key(output_dir: Path, key: str) -> Optional[Path]:
+    """Resolve a ``pending:<name>`` key straight to its snapshot path, without listing the directory."""
+    prefix, sep, name = str(key or "").partition(":")
+    if prefix != "pending" or not sep:
+        return None
+    # Only bare snapshot names; anything with a path component is rejected
+    if name != os.path.basename(name) or not is_pending_snapshot_name(name):
+        return None
+    path = output_dir / "pending" / name
+    if not path.is_file():
+        return None
+    return path
+
+
 def delete_all_pending(output_dir: Path) -> List[str]:
     deleted: List[str] = []
-    for entry in list_pending_files(output_dir):
-        path = Path(entry["path"])
+    snapshots, _ = scan_pending_dir(output_dir)
+    for path in snapshots:
         try:
             path.unlink()
-            deleted.append(entry["name"])
+            deleted.append(path.name)
             remove_pending_metadata(path)
         except FileNotFoundError:
             continue
@@ -1547,13 +1887,12 @@ def delete_all_pending(output_dir: Path) -> List[str]:
 
 
 def delete_single_pending(output_dir: Path, key: str) -> List[str]:
-    pending_files = {entry["key"]: entry for entry in list_pending_files(output_dir)}
-    if key not in pending_files:
+    path = pending_path_from_key(output_dir, key)
+    if path is None:
         raise FileNotFoundError(key)
-    path = Path(pending_files[key]["path"])
     path.unlink()
     remove_pending_metadata(path)
-    return [pending_files[key]["name"]]
+    return [path.name]
 
 
 def normalize_submission(
@@ -1565,20 +1904,20 @@ def normalize_submission(
 
     mode = (data.get("mode") or "add").strip().lower()
     original_id = (data.get("original_id") or "").strip()
-    existing_lower_map = {str(e).lower(): str(e) for e in existing_ids}
+    existing_lower = {str(e).lower() for e in existing_ids}
     editing_existing = mode == "edit" and bool(original_id)
-    if editing_existing and original_id.lower() not in existing_lower_map:
+    original_lower = original_id.lower() if editing_existing else ""
+    if editing_existing and original_lower not in existing_lower:
         errors["original_id"] = "Original net not found in the current snapshot."
 
     net_id = (data.get("id") or "").strip()
-    existing_lower = {str(e).lower() for e in existing_ids}
-    if editing_existing:
-        existing_lower.discard(original_id.lower())
+    net_id_lower = net_id.lower()
     if not net_id:
         errors["id"] = "ID is required."
     elif not ID_PATTERN.match(net_id):
         errors["id"] = "Use letters, numbers, hyphen, or underscore."
-    elif net_id.lower() in existing_lower:
+    elif net_id_lower in existing_lower and net_id_lower != original_lower:
+        # Keeping an edited net's own id is not a duplicate
         errors["id"] = "This ID already exists (case-insensitive)."
 
     name = (data.get("name") or "").strip()
@@ -1602,7 +1941,7 @@ def normalize_submission(
     start_local = (data.get("start_local") or "").strip()
     if not start_local:
         errors["start_local"] = "Start time is required."
-    elif not re.match(r"^\d{2}:\d{2}$", start_local):
+    elif not START_LOCAL_PATTERN.fullmatch(start_local):
         errors["start_local"] = "Use HH:MM format (24-hour)."
 
     duration = (data.get("duration_min") or "").strip()
@@ -1638,10 +1977,10 @@ def normalize_submission(
         key = (entry.get("key") or "").strip()
         value = sanitize_optional(entry.get("value"))
         if key and value:
-            if not re.match(r"^[A-Za-z0-9_:\-]+$", key):
+            if not CUSTOM_KEY_CHARS.issuperset(key):
                 errors.setdefault("custom_fields", "Custom keys may only contain letters, numbers, dash, underscore, or colon.")
                 continue
-            if key in OPTIONAL_FIELD_KEYS:
+            if key in OPTIONAL_FIELD_SET:
                 continue
             custom_fields.append((key, value))
 
@@ -1733,7 +2072,7 @@ def _apply_net_change(
                 cand_id = raw_id.lower()
                 cand_slug = slugify(raw_id)
                 if cand_id == target or (target_slug and cand_slug == target_slug):
-                    nets.append(candidate.copy())
+                    nets.append(candidate)
                     index = len(nets) - 1
                     break
         if index == -1:
@@ -1743,8 +2082,7 @@ def _apply_net_change(
                 f" Available ids include: {', '.join(available_ids[:5])}"
             )
         if expected_hash:
-            current_hash = compute_record_hash(nets[index])
-            if current_hash != expected_hash:
+            if not record_matches_hash(nets[index], expected_hash):
                 raise ValueError("This net changed in the meantime. Reload the latest snapshot and try again.")
         nets[index] = normalized_entry
     else:
@@ -1782,12 +2120,9 @@ def write_pending_snapshot(
 
     base_file = source_file or nets_file
     payload = load_nets_payload(base_file)
-    nets = []
-    for entry in payload.get("nets", []) or []:
-        if isinstance(entry, dict):
-            nets.append(entry.copy())
-        else:
-            nets.append(entry)
+    # Entries are shared with the nets cache. _apply_net_change only ever replaces
+    # list slots and save_nets_payload builds new dicts, so nothing mutates them.
+    nets = list(payload.get("nets", []) or [])
 
     canonical_cache: Optional[List[Dict[str, Any]]] = None
     for change in changes_list:
@@ -1891,8 +2226,22 @@ def write_pending_batch(
 
 
 def load_nets_map(path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
-    if not path or not path.exists():
-        return {}
+    return load_nets_map_with_digests(path)[0]
+
+
+def load_nets_map_with_digests(path: Optional[Path]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, bytes]]:
+    """Return the id -> net map and id -> net_digest map for ``path``, cached per file signature."""
+    if not path:
+        return {}, {}
+    signature = file_signature(path)
+    if signature is None:
+        return {}, {}
+    with NETS_CACHE_LOCK:
+        cached = NETS_MAP_CACHE.get(path)
+        if cached and cached[0] == signature:
+            NETS_MAP_CACHE.move_to_end(path)
+            return cached[1], cached[2]
+
     payload = load_nets_payload(path)
     nets = payload.get("nets", []) or []
     results: Dict[str, Dict[str, Any]] = {}
@@ -1903,7 +2252,13 @@ def load_nets_map(path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
         if not net_id:
             continue
         results[net_id.lower()] = net
-    return results
+    digests = {key: net_digest(net) for key, net in results.items()}
+    with NETS_CACHE_LOCK:
+        NETS_MAP_CACHE[path] = (signature, results, digests)
+        NETS_MAP_CACHE.move_to_end(path)
+        while len(NETS_MAP_CACHE) > NETS_CACHE_MAX_ENTRIES:
+            NETS_MAP_CACHE.popitem(last=False)
+    return results, digests
 
 
 def net_signature(net: Dict[str, Any]) -> str:
@@ -1920,28 +2275,25 @@ def net_signature(net: Dict[str, Any]) -> str:
         return json.dumps(sanitized, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
-def _ordered_field_keys(*nets: Dict[str, Any]) -> List[str]:
-    """Return a stable list of field keys present in either net."""
-    seen: List[str] = []
+def net_digest(net: Dict[str, Any]) -> bytes:
+    return hashlib.blake2b(net_signature(net).encode("utf-8"), digest_size=16).digest()
 
-    def add_key(candidate: str) -> None:
-        if candidate and candidate not in seen:
-            seen.append(candidate)
 
-    ordered_candidates = list(BASE_FIELD_KEYS) + list(OPTIONAL_FIELD_KEYS)
-    for key in ordered_candidates:
-        for net in nets:
-            if isinstance(net, dict) and key in net:
-                add_key(key)
-                break
+def _ordered_field_keys(*nets: Dict[str, Any]) -> List[str]:
+    """Return a stable list of field keys present in either net."""
+    net_dicts = [net for net in nets if isinstance(net, dict)]
+    # A dict doubles as an insertion-ordered set
+    seen: Dict[str, None] = {}
+    for key in KNOWN_FIELD_ORDER:
+        if any(key in net for net in net_dicts):
+            seen[key] = None
 
-    for net in nets:
-        if not isinstance(net, dict):
-            continue
-        for key in net.keys():
-            add_key(key)
+    for net in net_dicts:
+        for key in net:
+            if key:
+                seen.setdefault(key)
 
-    return seen
+    return list(seen)
 
 
 def _format_diff_value(value: Any) -> str:
@@ -1986,32 +2338,53 @@ def compute_field_diffs(before: Optional[Dict[str, Any]], after: Optional[Dict[s
 
 
 def summarize_pending_files(pending_entries: List[Dict[str, str]], canonical_file: Path) -> List[Dict[str, Any]]:
-    canonical_map = load_nets_map(canonical_file)
-    canonical_signatures = {key: net_signature(net) for key, net in canonical_map.items()}
-
-    summaries: List[Dict[str, Any]] = []
-    for entry in pending_entries:
-        path = Path(entry["path"])
-        pending_map = load_nets_map(path)
-        pending_signatures = {key: net_signature(net) for key, net in pending_map.items()}
-
-        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
-        changes: List[Dict[str, Any]] = []
-
-        seen = set()
-        for key, net in pending_map.items():
-            seen.add(key)
-            display_id = str(net.get("id") or "")
-            display_name = str(net.get("name") or "")
-            canonical_net = canonical_map.get(key)
-            if not canonical_net:
-                stats["added"] += 1
-                field_diffs = compute_field_diffs(None, net)
+    canonical_map, canonical_signatures = load_nets_map_with_digests(canonical_file)
+
+    return [summarize_pending_entry(entry, canonical_map, canonical_signatures) for entry in pending_entries]
+
+
+def summarize_pending_entry(
+    entry: Dict[str, str],
+    canonical_map: Dict[str, Dict[str, Any]],
+    canonical_signatures: Dict[str, bytes],
+) -> Dict[str, Any]:
+    path = Path(entry["path"])
+    pending_map, pending_signatures = load_nets_map_with_digests(path)
+
+    stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+    changes: List[Dict[str, Any]] = []
+
+    seen = set()
+    for key, net in pending_map.items():
+        seen.add(key)
+        display_id = str(net.get("id") or "")
+        display_name = str(net.get("name") or "")
+        canonical_net = canonical_map.get(key)
+        if not canonical_net:
+            stats["added"] += 1
+            field_diffs = compute_field_diffs(None, net)
+            changes.append(
+                {
+                    "id": display_id,
+                    "name": display_name,
+                    "type": "added",
+                    "load_id": display_id,
+                    "category": str(net.get("category") or ""),
+                    "start_local": str(net.get("start_local") or ""),
+                    "time_zone": str(net.get("time_zone") or ""),
+                    "field_diffs": field_diffs,
+                    "field_summary": [diff["field"] for diff in field_diffs],
+                }
+            )
+        else:
+            if pending_signatures[key] != canonical_signatures.get(key):
+                stats["updated"] += 1
+                field_diffs = compute_field_diffs(canonical_net, net)
                 changes.append(
                     {
                         "id": display_id,
                         "name": display_name,
-                        "type": "added",
+                        "type": "updated",
                         "load_id": display_id,
                         "category": str(net.get("category") or ""),
                         "start_local": str(net.get("start_local") or ""),
@@ -2021,91 +2394,64 @@ def summarize_pending_files(pending_entries: List[Dict[str, str]], canonical_fil
                     }
                 )
             else:
-                if pending_signatures[key] != canonical_signatures.get(key):
-                    stats["updated"] += 1
-                    field_diffs = compute_field_diffs(canonical_net, net)
-                    changes.append(
-                        {
-                            "id": display_id,
-                            "name": display_name,
-                            "type": "updated",
-                            "load_id": display_id,
-                            "category": str(net.get("category") or ""),
-                            "start_local": str(net.get("start_local") or ""),
-                            "time_zone": str(net.get("time_zone") or ""),
-                            "field_diffs": field_diffs,
-                            "field_summary": [diff["field"] for diff in field_diffs],
-                        }
-                    )
-                else:
-                    stats["unchanged"] += 1
+                stats["unchanged"] += 1
 
-        for key, canonical_net in canonical_map.items():
-            if key in pending_map:
-                continue
-            stats["removed"] += 1
-            field_diffs = compute_field_diffs(canonical_net, None)
-            changes.append(
-                {
-                    "id": str(canonical_net.get("id") or ""),
-                    "name": str(canonical_net.get("name") or ""),
-                    "type": "removed",
-                    "load_id": "",
-                    "category": str(canonical_net.get("category") or ""),
-                    "start_local": str(canonical_net.get("start_local") or ""),
-                    "time_zone": str(canonical_net.get("time_zone") or ""),
-                    "field_diffs": field_diffs,
-                    "field_summary": [diff["field"] for diff in field_diffs],
-                }
-            )
-
-        stats["total"] = len(pending_map)
-        stats["changed"] = stats["added"] + stats["updated"] + stats["removed"]
-
-        summary_entry = {
-            "key": entry["key"],
-            "name": entry["name"],
-            "label": entry.get("label", ""),
-            "created_at": entry.get("created_at", ""),
-            "changes": changes,
-            "stats": stats,
-            "submitted_by": entry.get("submitted_by", ""),
-            "submitted_at": entry.get("submitted_at", ""),
-            "note": entry.get("note", ""),
-        }
-        summaries.append(summary_entry)
+    for key, canonical_net in canonical_map.items():
+        if key in pending_map:
+            continue
+        stats["removed"] += 1
+        field_diffs = compute_field_diffs(canonical_net, None)
+        changes.append(
+            {
+                "id": str(canonical_net.get("id") or ""),
+                "name": str(canonical_net.get("name") or ""),
+                "type": "removed",
+                "load_id": "",
+                "category": str(canonical_net.get("category") or ""),
+                "start_local": str(canonical_net.get("start_local") or ""),
+                "time_zone": str(canonical_net.get("time_zone") or ""),
+                "field_diffs": field_diffs,
+                "field_summary": [diff["field"] for diff in field_diffs],
+            }
+        )
 
-    return summaries
+    stats["total"] = len(pending_map)
+    stats["changed"] = stats["added"] + stats["updated"] + stats["removed"]
+
+    summary_entry = {
+        "key": entry["key"],
+        "name": entry["name"],
+        "label": entry.get("label", ""),
+        "created_at": entry.get("created_at", ""),
+        "changes": changes,
+        "stats": stats,
+        "submitted_by": entry.get("submitted_by", ""),
+        "submitted_at": entry.get("submitted_at", ""),
+        "note": entry.get("note", ""),
+    }
+    return summary_entry
 
 
 def promote_pending_file(key: str, output_dir: Path, nets_file: Path, current_user: Optional[str] = None) -> Dict[str, Any]:
-    pending_lookup = {entry["key"]: entry for entry in list_pending_files(output_dir)}
-    if key not in pending_lookup:
+    pending_path = pending_path_from_key(output_dir, key)
+    if pending_path is None:
         raise FileNotFoundError(key)
 
-    pending_entry = pending_lookup[key]
-    pending_path = Path(pending_entry["path"])
-    if not pending_path.exists():
-        raise FileNotFoundError(pending_entry["path"])
-
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     backup_path = nets_file.with_name(f"{nets_file.stem}.backup.{timestamp}{nets_file.suffix}")
 
     if nets_file.exists():
         shutil.copy2(nets_file, backup_path)
 
-    pending_content = pending_path.read_text(encoding="utf-8")
-    tmp_path = nets_file.with_suffix(nets_file.suffix + ".tmp")
-    with tmp_path.open("w", encoding="utf-8") as fh:
-        fh.write(pending_content)
-    os.replace(tmp_path, nets_file)
+    atomic_write_bytes(nets_file, pending_path.read_bytes())
+    invalidate_nets_cache(nets_file)
 
     pending_path.unlink()
     remove_pending_metadata(pending_path)
 
     return {
-        "message": f"{pending_entry['name']} published to {nets_file.name}.",
-        "promoted": pending_entry["name"],
+        "message": f"{pending_path.name} published to {nets_file.name}.",
+        "promoted": pending_path.name,
         "backup": str(backup_path) if backup_path.exists() else "",
         "user": current_user,
         "active_source": "nets",
@@ -2139,8 +2485,21 @@ def build_edit_label(net_id: str, name: Optional[str]) -> str:
     return net_id
 
 
-def find_net_by_id(nets: Iterable[Dict[str, Any]], net_id: str) -> Tuple[Optional[Dict[str, Any]], str]:
+def find_net_by_id(
+    nets: Iterable[Dict[str, Any]],
+    net_id: str,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Tuple[Optional[Dict[str, Any]], str]:
     target_lower = str(net_id or "").lower()
+    if index is not None:
+        # The index is keyed by stripped ids, but this lookup matches case-insensitively
+        # only. A stripped target is always indexed under itself, so the scan below is
+        # only needed when whitespace makes the key ambiguous.
+        net = index.get(target_lower.strip())
+        if net is not None and str(net.get("id") or "").lower() == target_lower:
+            return net, str(net.get("id") or "")
+        if net is None and target_lower == target_lower.strip():
+            return None, ""
     for net in nets:
         if not isinstance(net, dict):
             continue
@@ -2171,9 +2530,8 @@ def build_form_state(
         values[key] = str(net.get(key) or "")
 
     custom_fields: List[Dict[str, str]] = []
-    known_keys = set(BASE_FIELD_KEYS) | set(OPTIONAL_FIELD_KEYS)
     for key, value in net.items():
-        if key in known_keys:
+        if key in KNOWN_FIELD_SET:
             continue
         if value in (None, "", []):
             continue
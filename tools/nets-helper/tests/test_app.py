@@ -1,8 +1,11 @@
+import os
 import subprocess
 from pathlib import Path
 
 import json
 
+import pytest
+
 import app as nets_app
 
 
@@ -70,6 +73,14 @@ def test_normalize_submission_rejects_duplicate_id():
     assert "id" in errors
     assert "already exists" in errors["id"]
 
+    edit = {**data, "mode": "edit", "original_id": "Alpha-Net"}
+    record, errors = nets_app.normalize_submission(edit, (net_id for net_id in ["alpha-net", "bravo-net"]), "America/New_York")
+    assert not errors
+    assert record["original_id"] == "Alpha-Net"
+
+    record, errors = nets_app.normalize_submission({**edit, "id": "Bravo-Net"}, ["alpha-net", "bravo-net"], "America/New_York")
+    assert "already exists" in errors["id"]
+
 
 def test_build_json_preview_handles_multiline_and_special_chars():
     record = {
@@ -469,3 +480,275 @@ def test_api_batch_publish_invalid_only_errors(client):
     body = response.get_json()
     assert body["failed"]
     assert "error" in body
+
+
+def test_json_response_with_and_without_orjson(app, monkeypatch):
+    payload = {"error": "Draft not found.", "path": "/tmp/nets.json", "name": "Café net"}
+    leaky = {"error": "Draft not found.", "path": Path("/tmp/nets.json")}
+    with app.app_context():
+        fast = nets_app.json_response(payload, 404)
+        with pytest.raises(TypeError):
+            nets_app.json_response(leaky, 404)
+        monkeypatch.setattr(nets_app, "orjson", None)
+        fallback = nets_app.json_response(payload, 404)
+        with pytest.raises(TypeError):
+            nets_app.json_response(leaky, 404)
+
+    for response in (fast, fallback):
+        assert response.status_code == 404
+        assert response.mimetype == "application/json"
+        assert response.get_json() == payload
+
+
+def test_load_nets_payload_cache_tracks_file_changes(sample_repo):
+    nets_file = sample_repo["nets_file"]
+    first = nets_app.load_nets_payload(nets_file)
+    first["nets"].append({"id": "scratch"})
+    first["time_zone"] = "UTC"
+
+    second = nets_app.load_nets_payload(nets_file)
+    assert [net["id"] for net in second["nets"]] == ["alpha-net"]
+    assert second["time_zone"] == "America/New_York"
+    assert second["nets"][0] is first["nets"][0]
+
+    payload = json.loads(nets_file.read_text(encoding="utf-8"))
+    payload["nets"][0]["name"] = "Alpha Net Renamed Externally"
+    nets_file.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    third = nets_app.load_nets_payload(nets_file)
+    assert third["nets"][0]["name"] == "Alpha Net Renamed Externally"
+    assert nets_app.extract_entry_record(nets_file, " ALPHA-NET ") is third["nets"][0]
+    assert nets_app.find_net_by_id([], "Alpha-Net", nets_app.load_nets_index(nets_file)) == (third["nets"][0], "alpha-net")
+    assert nets_app.extract_entry_record(nets_file, "missing") is None
+
+
+def test_find_net_by_id_matches_case_insensitively_without_stripping():
+    padded = {"id": " bravo-net"}
+    plain = {"id": "bravo-net"}
+    nets = [padded, plain]
+    index = nets_app.build_net_index(nets)
+
+    for lookup_index in (None, index):
+        assert nets_app.find_net_by_id(nets, "BRAVO-NET", lookup_index) == (plain, "bravo-net")
+        assert nets_app.find_net_by_id(nets, " Bravo-Net", lookup_index) == (padded, " bravo-net")
+        assert nets_app.find_net_by_id(nets, "bravo-net ", lookup_index) == (None, "")
+        assert nets_app.find_net_by_id(nets, "charlie-net", lookup_index) == (None, "")
+
+
+def test_compute_record_hash_ignores_key_order():
+    record = {"id": "alpha-net", "name": "Alpha Net", "duration_min": 60}
+    reordered = {"duration_min": 60, "name": "Alpha Net", "id": "alpha-net"}
+
+    assert nets_app.compute_record_hash(record) == nets_app.compute_record_hash(reordered)
+    assert nets_app.compute_record_hash(record) != nets_app.compute_record_hash({**record, "duration_min": 90})
+
+    assert nets_app.record_matches_hash(reordered, nets_app.compute_record_hash(record))
+    assert not nets_app.record_matches_hash({**record, "duration_min": 90}, nets_app.compute_record_hash(record))
+    assert not nets_app.record_matches_hash(record, "not-hex")
+
+
+def test_enforce_public_rate_limit_expires_old_entries(monkeypatch):
+    shards = [(nets_app.threading.Lock(), {}) for _ in range(nets_app.PUBLIC_RATE_LIMIT_SHARD_COUNT)]
+    monkeypatch.setattr(nets_app, "PUBLIC_RATE_LIMIT_SHARDS", shards)
+    monkeypatch.setattr(nets_app, "PUBLIC_RATE_LIMIT_LAST_SWEEP", 0.0)
+    real_datetime = nets_app.datetime
+    clock = {"now": 1_000_000.0}
+
+    class FakeDatetime:
+        @staticmethod
+        def now(tz=None):
+            return real_datetime.fromtimestamp(clock["now"], tz)
+
+    monkeypatch.setattr(nets_app, "datetime", FakeDatetime)
+
+    for _ in range(nets_app.PUBLIC_RATE_LIMIT_MAX):
+        nets_app.enforce_public_rate_limit("198.51.100.7")
+    with pytest.raises(nets_app.RateLimitExceeded):
+        nets_app.enforce_public_rate_limit("198.51.100.7")
+
+    nets_app.enforce_public_rate_limit("203.0.113.9")
+
+    clock["now"] += nets_app.PUBLIC_RATE_LIMIT_WINDOW_SECONDS
+    nets_app.enforce_public_rate_limit("198.51.100.7")
+    assert len(nets_app.public_rate_limit_shard("198.51.100.7")[1]["198.51.100.7"]) == 1
+    # The idle client was swept once the window elapsed, whichever shard it lives in
+    assert "203.0.113.9" not in nets_app.public_rate_limit_shard("203.0.113.9")[1]
+
+
+def test_roles_file_edits_apply_without_restart(app, client, sample_repo):
+    assert app.config["ROLE_NAMES"]["publishers"] == ["publisher"]
+
+    roles_file = sample_repo["roles_file"]
+    roles_file.write_text("publishers:\n  - publisher\n  - newcomer\nreviewers:\n  - reviewer\n", encoding="utf-8")
+    stat = roles_file.stat()
+    os.utime(roles_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    client.get("/api/pending")
+    assert app.config["ROLE_NAMES"]["publishers"] == ["newcomer", "publisher"]
+    assert "newcomer" in app.config["ROLES_DATA"]["publishers"]
+    assert nets_app.user_can_promote(app.config["USER_ROLES"], "newcomer")
+    assert not nets_app.user_can_promote(app.config["USER_ROLES"], "reviewer")
+
+
+def test_encode_json_document_matches_stdlib_format(monkeypatch):
+    payload = {"updated": "2024-01-01", "nets": [{"id": "café-net", "tags": [], "duration_min": 60}]}
+    expected = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+    assert nets_app.encode_json_document(payload) == expected
+    assert nets_app.decode_json_bytes(expected) == payload
+    monkeypatch.setattr(nets_app, "orjson", None)
+    assert nets_app.encode_json_document(payload) == expected
+    assert nets_app.decode_json_bytes(expected) == payload
+
+
+def test_normalize_net_entry_orders_known_keys_then_sorted_rest():
+    entry = {"zeta": 1, "notes": "", "zoom": "123", "name": "Net", "id": "net", "alpha": 2}
+    normalized = nets_app.normalize_net_entry(entry)
+
+    assert list(normalized) == ["id", "name", "zoom", "alpha", "notes", "zeta"]
+    assert normalized == entry
+
+
+def test_api_nets_returns_sized_json_body(client):
+    response = client.get("/api/nets")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert int(response.headers["Content-Length"]) == len(response.get_data())
+    assert [net["id"] for net in response.get_json()["nets"]]
+
+
+def test_git_head_helpers_match_git(sample_repo):
+    root = sample_repo["root"]
+    expected = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, check=True, capture_output=True, text=True).stdout.strip()
+
+    assert nets_app.read_git_head_commit(root) == expected
+    assert nets_app.git_current_branch(root) == "main"
+
+    subprocess.run(["git", "checkout", "-q", "--detach"], cwd=root, check=True)
+    assert nets_app.read_git_head_commit(root) == expected
+    assert nets_app.git_current_branch(root) == "main"
+
+
+def test_summarize_pending_files_keeps_entry_order(sample_repo):
+    for net_id, name in [("bravo-net", "Bravo"), ("charlie-net", "Charlie"), ("delta-net", "Delta")]:
+        _create_pending_net(sample_repo, net_id, name)
+
+    entries = nets_app.list_pending_files(sample_repo["root"])
+    assert len(entries) == 3
+    summaries = nets_app.summarize_pending_files(entries, sample_repo["nets_file"])
+
+    assert [summary["key"] for summary in summaries] == [entry["key"] for entry in entries]
+    assert all(summary["stats"]["added"] >= 1 for summary in summaries)
+
+
+def test_save_nets_payload_is_atomic_and_keeps_mode(sample_repo):
+    nets_file = sample_repo["nets_file"]
+    nets_file.chmod(0o640)
+    payload = nets_app.load_nets_payload(nets_file)
+    payload["nets"] = payload["nets"] + [{"id": "echo-net", "name": "Echo"}]
+
+    nets_app.save_nets_payload(nets_file, payload)
+
+    assert nets_file.stat().st_mode & 0o777 == 0o640
+    assert [net["id"] for net in json.loads(nets_file.read_text(encoding="utf-8"))["nets"]] == ["alpha-net", "echo-net"]
+    assert not list(nets_file.parent.glob(f".{nets_file.name}.*.tmp"))
+    # The cache was seeded by the save, so reading back does not reparse the file
+    assert nets_app.NETS_CACHE[nets_file][0] == nets_app.file_signature(nets_file)
+    assert nets_app.extract_entry_record(nets_file, "echo-net") == {"id": "echo-net", "name": "Echo"}
+
+
+def test_scan_pending_dir_feeds_listing_and_latest(sample_repo):
+    first = _create_pending_net(sample_repo, "bravo-net", "Bravo")
+    nets_app.pending_metadata_path(first).unlink()
+    (sample_repo["pending_dir"] / "notes.txt").write_text("ignore me", encoding="utf-8")
+
+    scan = nets_app.scan_pending_dir(sample_repo["root"])
+    assert scan[0] == [first]
+    assert nets_app.find_latest_pending_file(sample_repo["root"], scan) == first
+    listing = nets_app.list_pending_files(sample_repo["root"], scan)
+    assert [entry["name"] for entry in listing] == [first.name]
+    assert listing[0]["metadata"] == {}
+
+    assert nets_app.scan_pending_dir(sample_repo["root"] / "missing") == ([], set())
+
+
+def test_load_nets_map_with_digests_reuses_cached_maps(sample_repo):
+    nets_file = sample_repo["nets_file"]
+    first_map, first_digests = nets_app.load_nets_map_with_digests(nets_file)
+    second_map, second_digests = nets_app.load_nets_map_with_digests(nets_file)
+
+    assert second_map is first_map and second_digests is first_digests
+    assert first_digests["alpha-net"] == nets_app.net_digest(dict(reversed(list(first_map["alpha-net"].items()))))
+    assert nets_app.load_nets_map_with_digests(sample_repo["root"] / "missing.json") == ({}, {})
+
+
+def test_pending_path_from_key_resolves_without_listing(sample_repo):
+    pending_path = _create_pending_net(sample_repo, "bravo-net", "Bravo")
+    root = sample_repo["root"]
+
+    assert nets_app.pending_path_from_key(root, f"pending:{pending_path.name}") == pending_path
+    assert nets_app.pending_path_from_key(root, "nets") is None
+    assert nets_app.pending_path_from_key(root, "pending:nets.pending.20240101_000000.json") is None
+    assert nets_app.pending_path_from_key(root, "pending:../nets.pending.x.json") is None
+    assert nets_app.pending_path_from_key(root, f"pending:{nets_app.pending_metadata_path(pending_path).name}") is None
+
+    assert nets_app.delete_single_pending(root, f"pending:{pending_path.name}") == [pending_path.name]
+    assert not pending_path.exists()
+    assert not nets_app.pending_metadata_path(pending_path).exists()
+
+
+def test_write_pending_file_leaves_cached_entries_untouched(sample_repo):
+    nets_file = sample_repo["nets_file"]
+    cached_alpha = nets_app.load_nets_payload(nets_file)["nets"][0]
+    before = dict(cached_alpha)
+
+    edited = {**before, "name": "Alpha Net Edited"}
+    pending_path = nets_app.write_pending_file(
+        edited,
+        nets_file,
+        sample_repo["root"],
+        mode="edit",
+        original_id="alpha-net",
+        expected_hash=nets_app.compute_record_hash(cached_alpha),
+    )
+
+    assert cached_alpha == before
+    assert nets_app.load_nets_payload(pending_path)["nets"][0]["name"] == "Alpha Net Edited"
+
+
+def test_save_nets_payload_seeds_cache_with_its_own_signature(sample_repo, monkeypatch):
+    nets_file = sample_repo["nets_file"]
+    other = nets_file.with_name("other-writer.json")
+    other.write_text(json.dumps({"time_zone": "UTC", "nets": [{"id": "zulu-net"}]}) + "\n", encoding="utf-8")
+    real_replace = nets_app.os.replace
+
+    def racing_replace(src, dst):
+        real_replace(src, dst)
+        # Another writer lands right after our rename
+        real_replace(other, dst)
+
+    monkeypatch.setattr(nets_app.os, "replace", racing_replace)
+    nets_app.save_nets_payload(nets_file, {"nets": [{"id": "ours"}]})
+    monkeypatch.setattr(nets_app.os, "replace", real_replace)
+
+    assert [net["id"] for net in nets_app.load_nets_payload(nets_file)["nets"]] == ["zulu-net"]
+
+
+def test_git_current_branch_ignores_reftable_head_stub(sample_repo, monkeypatch):
+    root = sample_repo["root"]
+    git_dir = root / ".git"
+    # Simulate a reftable repository: stub HEAD plus the refStorage extension
+    (git_dir / "HEAD").write_text("ref: refs/heads/.invalid\n", encoding="utf-8")
+    with (git_dir / "config").open("a", encoding="utf-8") as fh:
+        fh.write("[extensions]\n\trefStorage = reftable\n")
+    calls = []
+
+    def fake_run_git_command(repo_root, args, env=None):
+        calls.append(args)
+        return subprocess.CompletedProcess(["git"] + args, 0, stdout="feature\n", stderr="")
+
+    monkeypatch.setattr(nets_app, "run_git_command", fake_run_git_command)
+
+    assert nets_app.git_current_branch(root) == "feature"
+    assert calls == [["rev-parse", "--abbrev-ref", "HEAD"]]
+    assert nets_app.read_git_head_commit(root) is None
@@ -26,12 +26,13 @@ REPO_ROOT = Path(os.environ.get("BHN_REPO_ROOT", str(Path.home())))
 DATA = REPO_ROOT / "_data"
 SCHED = DATA / "bhn_ncos_schedule.yml"
 NCOS  = DATA / "ncos.yml"
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 def load_yaml(p: Path):
     if not p.exists():
         raise FileNotFoundError(f"Missing input YAML: {p}")
     with p.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=YAML_LOADER) or {}
 
 def parse_hhmm(s: str) -> dtime:
     try: